@@ -56,19 +56,25 @@ Version
 1.0.0
 """
 
+import io
 import stat
 import os
 import sys
+import atexit
+import queue
+import threading
 import logging
+import logging.handlers
 import time
 import tqdm
 import datetime
+import functools
 import subprocess
 import shlex
 import argparse
 import _io
 import unitable
-from typing import TypeVar, Any, Callable
+from typing import TypeVar, Any, Callable, Tuple
 
 from general.exceptions import NoUniquePathException
 from general.fsutils import SearchPath
@@ -77,6 +83,125 @@ from general.term import Term
 
 ProcInfoT = TypeVar('T', bound='ProcInfo')
 
+# Log file records are buffered off the calling thread and written in batches.
+# Set PROCINFO_LOG_UNBUFFERED=1 to write every record (and console line) as soon as it is logged.
+_LOG_UNBUFFERED = bool(os.environ.get("PROCINFO_LOG_UNBUFFERED"))
+_LOG_BUFFER_CAPACITY = 8192  # Bytes of encoded log lines held before the buffer is written out
+_LOG_FLUSH_INTERVAL = 1.0  # Seconds between periodic flushes of the buffer
+_READ_MODES = frozenset({"r", "rb", "r+", "rb+", "rt", "rt+"})  # open() modes for ProcInfo.open()
+_WRITE_MODES = frozenset({"w", "wb", "w+", "wb+", "wt", "wt+"})
+_APPEND_MODES = frozenset({"a", "ab", "a+", "ab+", "at", "at+"})
+_LEVELS = {name: getattr(logging, name) for name in ("CRITICAL", "FATAL", "ERROR", "WARNING", "WARN", "INFO", "DEBUG", "NOTSET")}
+_shlex_split = shlex.split
+_PIPE = subprocess.PIPE
+_Popen = subprocess.Popen
+_run = subprocess.run
+_SHLEX_SPECIAL = frozenset(" \t\r\n'\"\\")  # Characters that make shlex.split() do more than return [cmd]
+
+
+def _split_command(cmd: str) -> list:
+    """
+    Split a command string into arguments like `shlex.split()`.
+
+    A non-empty command without whitespace, quotes or backslashes is a single
+    argument, so it is returned as-is without creating a shlex lexer. Pass a list
+    of arguments to avoid splitting altogether.
+
+    Parameters
+    ----------
+    cmd : str
+        The command string.
+
+    Returns
+    -------
+    list
+        The command arguments.
+
+    Example
+    -------
+    >>> _split_command("ls")
+    ['ls']
+    >>> _split_command("ls -l 'My Documents'")
+    ['ls', '-l', 'My Documents']
+    """
+    if cmd and _SHLEX_SPECIAL.isdisjoint(cmd):
+        return [cmd]
+    return _shlex_split(cmd)
+
+
+class BytesBufferHandler(logging.Handler):
+    """
+    A logging handler that encodes formatted records into a byte buffer and writes it to a file in bulk.
+
+    Each record is formatted and UTF-8 encoded as it is handled, and appended to a
+    `bytearray`. The buffer is written to the file with `os.write()` when it holds at
+    least `capacity` bytes, when a record at `flush_level` or above arrives, and
+    whenever `flush()` is called. This gives one write per batch of log lines instead
+    of one per line.
+
+    Parameters
+    ----------
+    filename : str
+        The log file to write to.
+    mode : str, optional
+        'a' to append to the file, or 'w' to truncate it first (default is 'a').
+    capacity : int, optional
+        The number of buffered bytes that triggers a write (default is 8192).
+    flush_level : int, optional
+        Records at this level or above are written out immediately (default is logging.ERROR).
+
+    Example
+    -------
+    >>> handler = BytesBufferHandler('/tmp/example.log', mode='w')
+    >>> handler.setFormatter(logging.Formatter('%(levelname)s %(message)s'))
+    >>> logging.getLogger().addHandler(handler)
+    """
+
+    def __init__(self, filename: str, mode: str = 'a', capacity: int = 8192, flush_level: int = logging.ERROR):
+        super().__init__()
+        self.baseFilename = os.path.abspath(filename)
+        self.capacity = capacity
+        self.flush_level = flush_level
+        self._buffer = bytearray()
+        flags = os.O_WRONLY | os.O_CREAT | (os.O_APPEND if 'a' in mode else os.O_TRUNC)
+        self._fd = os.open(self.baseFilename, flags, 0o666)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self._buffer += self.format(record).encode('utf-8', 'replace') + b"\n"
+        except Exception:
+            self.handleError(record)
+            return
+        if len(self._buffer) >= self.capacity or record.levelno >= self.flush_level:
+            self._write_buffer()
+
+    def _write_buffer(self) -> None:
+        # The caller holds the handler lock.
+        if not self._buffer or self._fd < 0:
+            return
+        data = memoryview(bytes(self._buffer))
+        self._buffer.clear()
+        while data:
+            data = data[os.write(self._fd, data):]
+
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            self._write_buffer()
+        finally:
+            self.release()
+
+    def close(self) -> None:
+        self.acquire()
+        try:
+            self._write_buffer()
+            if self._fd >= 0:
+                os.close(self._fd)
+                self._fd = -1
+        finally:
+            self.release()
+        super().close()
+
 
 class ProcInfo(CommonFormattingBase):
     """
@@ -148,8 +273,24 @@ class ProcInfo(CommonFormattingBase):
         Creates a toggle-able option in the argument parser.
     """
 
+    # Attributes only ever set per instance. Anything also defined on the class (below, or by
+    # _init_term()) must not be listed, since a slot would clash with (or be replaced by) it.
+    # CommonFormattingBase has no __slots__, so instances still have a __dict__ for subclasses.
+    __slots__ = (
+        '_args_dict', '_config_file', '_config_file_missing', '_critical_count', '_cwd',
+        '_error_count', '_exception_count', '_homedir', '_last_subprocess', '_log_critical',
+        '_log_debug', '_log_dir', '_log_error', '_log_info', '_log_warning', '_max_error_count',
+        '_max_warning_count', '_prefix_console', '_rerun_cmd_str', '_t_0', '_warning_count',
+        '_write_line', 'logfile',
+    )
+
     _logger = None
+    _console_prefixes = {}  # prefix -> (prefix + " ", prefix + ": "), filled by _init_term()
+    _log_listener = None  # The QueueListener writing the log file, if any
     _to_stdout = True
+    _log_to_file = True
+    _cached_elapsed = (-1, "")  # (whole seconds, formatted) for _coarse_elapsed_str()
+    _max_console_lvl = float('inf')  # Messages with a larger lvl are not shown on the console
     _console_fh = sys.stdout
     _verbosity = 1
     _term_colors = True
@@ -157,6 +298,8 @@ class ProcInfo(CommonFormattingBase):
     _debug = False
     _parser = None  # The argparse parser for ALL ProcInfos
     _toggle_args = {}  # To track toggler() args for display / checking
+    # Default config file names, in lookup order, where {b} is the script's basename.
+    _CONFIG_PATTERNS = ("{b}", ".{b}", ".{b}.cfg", "{b}.cfg", ".{b}.conf", "{b}.conf", ".{b}.config", "{b}.config")
 
     def __init__(self, args: argparse.Namespace, log: bool = True, prefix_console: bool = True, stderr: bool = False) -> None:
         """
@@ -177,6 +320,9 @@ class ProcInfo(CommonFormattingBase):
         self._log_to_file = log or self.get_arg('no_log', False)
         self._prefix_console = prefix_console
         self._config_file = None
+        self._config_file_missing = False
+        self._cwd = os.getcwd()  # Directories searched for the config file, looked up once
+        self._homedir = os.path.expanduser("~")
         self._critical_count = 0
         self._error_count = 0
         self._max_error_count = 0
@@ -189,12 +335,87 @@ class ProcInfo(CommonFormattingBase):
         self._rerun_cmd_str = None
         self._log_dir = None
         self._console_fh = sys.stderr if stderr else sys.stdout
+        self._write_line = self._console_writer(self._console_fh)
+        # Bound once here rather than looked up through self.logger for every message. This is the
+        # root logger, which _init_logger() configures (see _do_output()) and stores in ProcInfo._logger.
+        root_logger = logging.getLogger()
+        self._log_debug = root_logger.debug
+        self._log_info = root_logger.info
+        self._log_warning = root_logger.warning
+        self._log_error = root_logger.error
+        self._log_critical = root_logger.critical
         ProcInfo._init_term()
+        self._update_max_console_lvl()
 
         # Set log directory from args if provided
         if hasattr(args, 'log_dir'):
             self.log_dir = args.log_dir  # Use the property setter
-        pass  # for auto-indentation
+
+    def _should_log_info(self, lvl: int = 1) -> bool:
+        """
+        Check whether an info message at a verbosity level would be shown or logged.
+
+        Use this to skip building an expensive message that would be thrown away.
+
+        Parameters
+        ----------
+        lvl : int, optional
+            The verbosity level of the message (default is 1).
+
+        Returns
+        -------
+        bool
+            True if `info(msg, lvl=lvl)` would write the message to the console or the log file.
+
+        Example
+        -------
+        >>> proc = ProcInfo(args)
+        >>> if proc._should_log_info():
+        >>>     proc.info(f"Running: {shlex.join(cmd_args)}")
+        """
+        return lvl <= self._max_console_lvl or self._file_logs(logging.INFO)
+
+    def _update_max_console_lvl(self) -> None:
+        """
+        Recompute the verbosity level above which messages are not shown on the console.
+
+        Messages are only shown on the console if their level is at most the verbosity,
+        and never if console output is off. `debug`, `info` and `print` return immediately
+        for messages above this level which the log file would not record either
+        (see `_file_logs`).
+
+        Example
+        -------
+        >>> proc = ProcInfo(args)
+        >>> proc._update_max_console_lvl()
+        """
+        if self._to_stdout:
+            self._max_console_lvl = self._verbosity
+        else:
+            self._max_console_lvl = float('-inf')
+
+    def _file_logs(self, level: int) -> bool:
+        """
+        Check whether a message at a logging level would be written to the log file.
+
+        Parameters
+        ----------
+        level : int
+            The logging level (e.g., logging.DEBUG).
+
+        Returns
+        -------
+        bool
+            True if logging to a file and the logger is enabled for `level` (or has not
+            been set up yet, in which case it cannot be ruled out).
+
+        Example
+        -------
+        >>> proc = ProcInfo(args)
+        >>> proc._file_logs(logging.DEBUG)
+        True
+        """
+        return self._log_to_file and (ProcInfo._logger is None or ProcInfo._logger.isEnabledFor(level))
 
     def set_log_to_file(self, val: bool) -> ProcInfoT:
         """
@@ -257,6 +478,7 @@ class ProcInfo(CommonFormattingBase):
         - The verbosity level is adjusted based on the `verbosity` or `verbose` arguments.
         """
         self._args = args
+        self._args_dict = vars(args) if args is not None else {}  # Live view of the arguments for quick lookups
         self._debug = False
         for attr in ["debug", "debug_on", "debugging", "debugging_on"]:
             if self.get_arg(attr):
@@ -271,6 +493,7 @@ class ProcInfo(CommonFormattingBase):
             self._verbosity = self.get_arg('verbose', False)
         else:
             self._verbosity = 1
+        self._update_max_console_lvl()
         return self
 
     @property
@@ -674,7 +897,6 @@ class ProcInfo(CommonFormattingBase):
         if self._log_dir is None:
             # Set a default log directory if none is provided
             self._log_dir = self.get_arg('output_dir', self.START_WORKING_DIRECTORY)
-            pass  # for auto-indentation
         return self._log_dir
 
     @log_dir.setter
@@ -710,8 +932,6 @@ class ProcInfo(CommonFormattingBase):
         if not os.path.exists(self._log_dir):
             os.makedirs(self._log_dir, exist_ok=True)  # Ensure directory creation
             self.info(f"Created log directory: {self._log_dir}")  # Log directory creation
-            pass  # for auto-indentation
-        pass  # for auto-indentation
 
     @property
     def args(self) -> argparse.Namespace:
@@ -929,6 +1149,26 @@ class ProcInfo(CommonFormattingBase):
         """
         return datetime.timedelta(seconds=int(time.monotonic() - CommonConstants.START_SECS))
 
+    def _coarse_elapsed_str(self) -> str:
+        """
+        Get `coarse_elapsed_td` as a string, formatting it at most once per elapsed second.
+
+        Returns
+        -------
+        str
+            The elapsed time since the start of the script without fractions of a second (e.g., '0:01:05').
+
+        Example
+        -------
+        >>> proc = ProcInfo(args)
+        >>> proc._coarse_elapsed_str()
+        '0:01:05'
+        """
+        secs = int(time.monotonic() - CommonConstants.START_SECS)
+        if secs != self._cached_elapsed[0]:
+            self._cached_elapsed = (secs, str(datetime.timedelta(seconds=secs)))
+        return self._cached_elapsed[1]
+
     def now(self) -> float:
         """
         Get the current monotonic time.
@@ -969,23 +1209,19 @@ class ProcInfo(CommonFormattingBase):
         >>> print(log_filename)
         /path/to/log/directory/logfile.log
         """
-        log_filename = self.get_arg('log_filename')
+        args = self._args_dict
+        log_filename = args.get('log_filename')
         if log_filename is not None:
             return log_filename
-        self._log_dir = self.get_arg('log_dir', self.get_arg('output_dir'))
+        self._log_dir = args.get('log_dir', args.get('output_dir'))
         if self._log_dir is None:
-            if self.get_arg('output') is not None:
-                self._log_dir = self.get_arg('output')
+            if args.get('output') is not None:
+                self._log_dir = args['output']
                 if not os.path.isdir(self._log_dir):
                     self._log_dir = os.path.dirname(self._log_dir)
-                    pass  # for auto-indentation
-                pass  # for auto-indentation
             else:
                 self._log_dir = self.START_WORKING_DIRECTORY
-                pass  # for auto-indentation
-        if not os.path.exists(self._log_dir):
-            os.makedirs(self._log_dir)
-            pass  # for auto-indentation
+        os.makedirs(self._log_dir, exist_ok=True)
         return self.get_unique_filename('log', directory=self._log_dir)
 
     def _init_logger(self) -> None:
@@ -1021,50 +1257,127 @@ class ProcInfo(CommonFormattingBase):
             self.warning("(Re)setting args value for {self.__class__.__name__} "
                          "after logger has been configured. One or more "
                          "Logger(s) may not contain all output.")
-            pass  # for auto-indentation
-        log_line_format = self.get_arg('log_line_format', '%(asctime)s %(levelname)-8s %(message)s')
-        log_date_format = self.get_arg('log_date_format', '%Y-%m-%d %H:%M:%S')
-        log_file_mode = self.get_arg('log_file_mode', 'a')
-        log_level = self.get_arg('log_level', 'DEBUG')
-        if hasattr(logging, log_level):
-            log_level = getattr(logging, log_level)
-        else:
+        args = self._args_dict
+        log_line_format = args.get('log_line_format', '%(asctime)s %(levelname)-8s %(message)s')
+        log_date_format = args.get('log_date_format', '%Y-%m-%d %H:%M:%S')
+        log_file_mode = args.get('log_file_mode', 'a')
+        log_level = args.get('log_level', 'DEBUG')
+        try:
+            log_level = _LEVELS[log_level]
+        except KeyError:
             raise ValueError("Unable to set file logging level to "
                              f"'{log_level}'."
-                             f" There is no logging.{log_level} level.")
+                             f" There is no logging.{log_level} level.") from None
         if self._log_to_file:
             self.logfile = self._get_log_filename()
-            if not os.path.exists(os.path.dirname(self.logfile)):
-                os.makedirs(os.path.dirname(self.logfile), exist_ok=True)
-                pass  # for auto-indentation
+            log_dir = os.path.dirname(self.logfile)
+            if log_dir:  # A bare filename (from --log-filename) goes in the current directory
+                os.makedirs(log_dir, exist_ok=True)
         else:
             self.logfile = None
-            pass  # for auto-indentation
-        logging.basicConfig(
-            level=log_level,
-            format=log_line_format,
-            datefmt=log_date_format,
-            filename=self.logfile,
-            filemode=log_file_mode,
-        )
+        if self.logfile is None or _LOG_UNBUFFERED:
+            logging.basicConfig(
+                level=log_level,
+                format=log_line_format,
+                datefmt=log_date_format,
+                filename=self.logfile,
+                filemode=log_file_mode,
+            )
+        else:
+            self._start_log_listener(log_level, log_line_format, log_date_format, log_file_mode)
         ProcInfo._logger = logging.getLogger()
         if self._log_to_file:
-            self.info(f"Writing to log file '{self.logfile}'")
-            self._rerun_cmd_str = []
-            for arg in sys.argv:
-                if " " in arg:
-                    arg = arg.replace("\\", "\\\\")
-                    arg = arg.replace("'", "\\'")
-                    arg = f"'{arg}'"
-                    pass  # for auto-indentation
-                self._rerun_cmd_str.append(arg)
-            self._rerun_cmd_str = f"cd {self.START_WORKING_DIRECTORY} && " + " ".join(self._rerun_cmd_str)
-            self.info(f"To Re-run This Command:\n{self._rerun_cmd_str}")
-            self.info(f"DEBUG LEVEL: {logging.DEBUG}")
-            self.info(f"Global Log Level: {logging.getLogger().getEffectiveLevel()}")
-            self.info(f"This ProcInfo Log Level: {ProcInfo._logger.getEffectiveLevel()}")
-            pass  # for auto-indentation
-        pass  # for auto-indentation
+            self.info("Writing to log file '%s'", self.logfile)
+            self._rerun_cmd_str = f"cd {shlex.quote(self.START_WORKING_DIRECTORY)} && {shlex.join(sys.argv)}"
+            self.info("To Re-run This Command:\n%s", self._rerun_cmd_str)
+            self.info("DEBUG LEVEL: %s", logging.DEBUG)
+            self.info("Global Log Level: %s", logging.getLogger().getEffectiveLevel())
+            self.info("This ProcInfo Log Level: %s", ProcInfo._logger.getEffectiveLevel())
+
+    def _start_log_listener(self, log_level: int, log_line_format: str, log_date_format: str, log_file_mode: str) -> None:
+        """
+        Route root logger records through a queue to a buffered log file writer.
+
+        The root logger gets a `QueueHandler`, so logging a record only costs a
+        queue put on the calling thread. A `QueueListener` thread drains the queue
+        into a `BytesBufferHandler` which writes to the log file in batches, whenever
+        its buffer fills up, an ERROR (or worse) record arrives, or every
+        `_LOG_FLUSH_INTERVAL` seconds. Everything is flushed and closed at exit.
+
+        Parameters
+        ----------
+        log_level : int
+            The logging level for the root logger.
+        log_line_format : str
+            The format string for each log line.
+        log_date_format : str
+            The format string for the date in each log line.
+        log_file_mode : str
+            The mode with which to open the log file (e.g., 'a' or 'w').
+
+        Example
+        -------
+        >>> proc = ProcInfo(args)
+        >>> proc._start_log_listener(logging.DEBUG, '%(message)s', '%Y-%m-%d', 'a')
+
+        Notes
+        -----
+        - Like `logging.basicConfig()`, this does nothing if the root logger already has handlers.
+        - Set the `PROCINFO_LOG_UNBUFFERED` environment variable to bypass this and write synchronously.
+        """
+        root = logging.getLogger()
+        if root.handlers:
+            return
+        file_handler = self._make_log_file_handler(log_file_mode)
+        file_handler.setFormatter(logging.Formatter(log_line_format, log_date_format))
+        log_queue = queue.SimpleQueue()
+        root.setLevel(log_level)
+        root.addHandler(logging.handlers.QueueHandler(log_queue))
+        listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+        listener.start()
+        stop_flushing = threading.Event()
+
+        def flush_periodically():
+            while not stop_flushing.wait(_LOG_FLUSH_INTERVAL):
+                file_handler.flush()
+
+        def stop_listener():
+            stop_flushing.set()
+            listener.stop()
+            file_handler.close()
+
+        threading.Thread(target=flush_periodically, name="ProcInfoLogFlusher", daemon=True).start()
+        atexit.register(stop_listener)
+        ProcInfo._log_listener = listener
+
+    def _make_log_file_handler(self, log_file_mode: str) -> logging.Handler:
+        """
+        Create the handler that writes buffered log records to the log file.
+
+        This is called once, on the thread setting up logging (see `_start_log_listener`).
+        The handler it returns is then used from several threads at once: `emit()` runs on
+        the `QueueListener` thread, `flush()` on the periodic flusher thread, and `flush()`
+        and `close()` on the exit path. Override this to write the log file some other way
+        (e.g., a platform-specific asynchronous I/O writer), but the handler must be
+        thread-safe, e.g. by holding the handler lock around its buffer as
+        `BytesBufferHandler` does.
+
+        Parameters
+        ----------
+        log_file_mode : str
+            The mode with which to open the log file (e.g., 'a' or 'w').
+
+        Returns
+        -------
+        logging.Handler
+            The handler writing to `self.logfile`.
+
+        Example
+        -------
+        >>> proc = ProcInfo(args)
+        >>> handler = proc._make_log_file_handler('a')
+        """
+        return BytesBufferHandler(self.logfile, mode=log_file_mode, capacity=_LOG_BUFFER_CAPACITY)
 
     def get_unique_filename(self, extension: str = 'txt', basename: str = None, directory: str = None, max_tries: int = 1000) -> str:
         """
@@ -1110,19 +1423,21 @@ class ProcInfo(CommonFormattingBase):
             if not os.path.exists(filename):
                 return filename
             basename = self.UNIQUE_BASENAME
-            pass  # for auto-indentation
         num = 0
-        filename = os.path.join(directory, f"{basename}{extension}")
-        while os.path.exists(filename):
-            num += 1
-            if num > max_tries:
-                raise NoUniquePathException(
-                    "Unable to find an unused and non-existent "
-                    f"filename with base '{basename}' and extension"
-                    f" '{extension}' in directory '{directory}' after"
-                    f" {num:,} tries.")
-            filename = os.path.join(directory, f"{basename}-{num:03d}{extension}")
-            pass  # for auto-indentation
+        base_prefix = os.path.join(directory, basename)  # Joined once; candidates only differ in their suffix
+        filename = f"{base_prefix}{extension}"
+        if os.path.exists(filename):
+            # The plain name is taken: list the directory once for the numbered candidates
+            exists = self._exists_checker(filename)
+            while exists(filename):
+                num += 1
+                if num > max_tries:
+                    raise NoUniquePathException(
+                        "Unable to find an unused and non-existent "
+                        f"filename with base '{basename}' and extension"
+                        f" '{extension}' in directory '{directory}' after"
+                        f" {num:,} tries.")
+                filename = f"{base_prefix}-{num:03d}{extension}"
         return filename
 
     def get_unique_path(self, extension: str = None, basename: str = None, directory: str = None, max_tries: int = 1000, create: bool = True) -> str:
@@ -1170,23 +1485,61 @@ class ProcInfo(CommonFormattingBase):
             if not os.path.exists(filename):
                 return filename
             basename = self.UNIQUE_BASENAME
-            pass  # for auto-indentation
         num = 0
-        fullpath = os.path.join(directory, f"{basename}")
-        while os.path.exists(fullpath):
-            num += 1
-            if num > max_tries:
-                raise NoUniquePathException(
-                    "Unable to find an unused and non-existent "
-                    f"directory path with base '{basename}' in directory '{directory}' after"
-                    f" {num:,} tries.")
-            fullpath = os.path.join(directory, f"{basename}-{num:03d}")
-            pass  # for auto-indentation
+        base_prefix = fullpath = os.path.join(directory, basename)
+        if os.path.exists(fullpath):
+            # The plain name is taken: list the directory once for the numbered candidates
+            exists = self._exists_checker(fullpath)
+            while exists(fullpath):
+                num += 1
+                if num > max_tries:
+                    raise NoUniquePathException(
+                        "Unable to find an unused and non-existent "
+                        f"directory path with base '{basename}' in directory '{directory}' after"
+                        f" {num:,} tries.")
+                fullpath = f"{base_prefix}-{num:03d}"
         if create:
             self.mkdir(fullpath)
-            pass  # for auto-indentation
         return fullpath
 
+    def _exists_checker(self, path: str) -> Callable[[str], bool]:
+        """
+        Return a function telling whether paths in the same directory as `path` exist.
+
+        The directory is listed once, when this is called, and candidates found in that
+        listing are reported as existing without a stat() call. Any other candidate is
+        checked with `os.path.exists`, so a name is never reported as free because the
+        listing missed it (e.g., a file created since by another process). Callers should
+        only build a checker once a first candidate, checked with `os.path.exists`, turned
+        out to be taken; a single free name is cheaper to stat than to list the directory for.
+
+        Parameters
+        ----------
+        path : str
+            A path in the directory whose entries will be checked.
+
+        Returns
+        -------
+        Callable[[str], bool]
+            A function returning True if the given path (in that directory) exists.
+
+        Example
+        -------
+        >>> proc = ProcInfo(args)
+        >>> exists = proc._exists_checker('/path/to/example.txt')
+        >>> exists('/path/to/example.txt')  # In the listing: a set lookup, no stat()
+        True
+        >>> exists('/path/to/example-001.txt')  # Not in the listing: still costs a stat() to confirm
+        False
+        """
+        try:
+            names = frozenset(os.listdir(os.path.dirname(os.path.abspath(path)) or os.sep))
+        except FileNotFoundError:
+            names = frozenset()
+        except OSError:
+            return os.path.exists
+        return lambda candidate: os.path.basename(candidate) in names or os.path.exists(candidate)
+
     def mkdir(self, fullpath: str):
         """
         Create a directory if it does not already exist.
@@ -1215,15 +1568,14 @@ class ProcInfo(CommonFormattingBase):
         >>> proc.mkdir('/path/to/directory')
         >>> print("Directory created.")
         """
-        if os.path.exists(fullpath):
+        try:
+            os.makedirs(fullpath)
+        except FileExistsError:
             if os.path.isdir(fullpath):
                 self.debug(f"Not re-creating existing directory '{fullpath}'.")
                 return self
-            else:
-                raise OSError(f"Cannot create directory '{fullpath}'. File exists and is not a directory.")
-            pass  # for auto-indentation
+            raise OSError(f"Cannot create directory '{fullpath}'. File exists and is not a directory.") from None
         self.info(f"Creating directory '{fullpath}'.")
-        os.makedirs(fullpath, exist_ok=True)
         return self
 
     @staticmethod
@@ -1251,13 +1603,11 @@ class ProcInfo(CommonFormattingBase):
         >>>     for line in ProcInfo.preserve_tell(f):
         >>>         print(line, end='')
         """
-        while True:
-            line = file_handle.readline()
-            if not line:
-                break
+        line = file_handle.readline()
+        if line:
             yield line
-            pass  # for auto-indentation
-        pass  # for auto-indentation
+            # line[:0] is '' or b'', the end-of-file sentinel for text or binary handles.
+            yield from iter(file_handle.readline, line[:0])
 
     @staticmethod
     def _init_term() -> None:
@@ -1288,8 +1638,36 @@ class ProcInfo(CommonFormattingBase):
             ProcInfo._crit_prefix = "[CRIT]"
             ProcInfo._fata_prefix = "[FATA]"
             ProcInfo._exep_prefix = "[EXCE]"
-            pass  # for auto-indentation
-        pass  # for auto-indentation
+        ProcInfo._console_prefixes = {}
+        for prefix in (ProcInfo._debu_prefix, ProcInfo._info_prefix, ProcInfo._warn_prefix, ProcInfo._erro_prefix,
+                       ProcInfo._crit_prefix, ProcInfo._fata_prefix, ProcInfo._exep_prefix, ""):
+            ProcInfo._console_prefix_variants(prefix)
+
+    @staticmethod
+    def _console_prefix_variants(prefix: str) -> Tuple[str, str]:
+        """
+        Return the cached console variants of a log prefix.
+
+        Parameters
+        ----------
+        prefix : str
+            The log prefix (e.g., `ProcInfo._info_prefix`).
+
+        Returns
+        -------
+        Tuple[str, str]
+            The prefix followed by a space (used before the elapsed time) and the
+            prefix followed by ': ' (or '' when the prefix is empty).
+
+        Example
+        -------
+        >>> ProcInfo._console_prefix_variants("[INFO]")
+        ('[INFO] ', '[INFO]: ')
+        """
+        variants = ProcInfo._console_prefixes.get(prefix)
+        if variants is None:
+            variants = ProcInfo._console_prefixes[prefix] = (f"{prefix} ", f"{prefix}: " if prefix else "")
+        return variants
 
     def use_term_colors(self, val: bool) -> ProcInfoT:
         """
@@ -1394,13 +1772,74 @@ class ProcInfo(CommonFormattingBase):
             self.debug(f"Setting Logger console_fh to a tqdm type='{type(val).__name__}' progress bar '{val}'.")
         else:
             self.debug(f"Setting Logger console_fh to '{val}'.")
-            pass  # for auto-indentation
         if not self.has_bar:
             self._console_fh.flush()
         self._console_fh = val
+        self._write_line = self._console_writer(self._console_fh)
         return self
 
-    def _console(self, prefix: str, msg: str, lvl: int = -999):
+    @staticmethod
+    def _console_writer(fh: _io._IOBase) -> Callable[[str], Any]:
+        """
+        Choose how complete console lines are written to a console file handle.
+
+        The choice is made once per handle, so `_console` does not have to check the
+        handle type for every message.
+
+        Parameters
+        ----------
+        fh : _io._IOBase
+            The console file handle (e.g., sys.stdout, or a tqdm progress bar).
+
+        Returns
+        -------
+        Callable[[str], Any]
+            A function writing a line (including its trailing newline) to `fh`.
+
+        Example
+        -------
+        >>> write_line = ProcInfo._console_writer(sys.stdout)
+        >>> write_line("Hello, world!\n")
+        """
+        if isinstance(fh, tqdm.tqdm):
+            return functools.partial(fh.write, end="")
+        if isinstance(fh, (io.RawIOBase, io.BufferedIOBase)):
+            # Binary handle: a single write of the already encoded line.
+            def write_line(line):
+                fh.write(line.encode('utf-8'))
+                fh.flush()
+            return write_line
+        if _LOG_UNBUFFERED or not getattr(fh, 'line_buffering', False):
+            # Each message is a single write (see _console()); flush it so it keeps its
+            # place among whatever else the process writes to its streams.
+            def write_line(line):
+                fh.write(line)
+                fh.flush()
+            return write_line
+        return fh.write
+
+    def _flush_console(self) -> ProcInfoT:
+        """
+        Flush the console file handle.
+
+        Returns
+        -------
+        ProcInfoT
+            Returns the instance of ProcInfo to allow for method chaining.
+
+        Example
+        -------
+        >>> proc = ProcInfo(args)
+        >>> proc.info("Done.")._flush_console()
+        """
+        if not self.has_bar:
+            try:
+                self._console_fh.flush()
+            except (AttributeError, ValueError, OSError):
+                pass  # Closed or not flushable; nothing to do.
+        return self
+
+    def _console(self, prefix: str, msg: str, lvl: int = -999, args: tuple = ()):
         """
         Handle printing to stdout/stderr in a way that works with tqdm.
 
@@ -1416,6 +1855,10 @@ class ProcInfo(CommonFormattingBase):
             The message to print.
         lvl : int, optional
             The verbosity level of the message (default is -999).
+        args : tuple, optional
+            Arguments merged into the message with the `%` operator, like the logging
+            module does, only if the message is printed (default is no arguments). If they
+            do not fit the message, the message is printed as it is.
 
         Returns
         -------
@@ -1426,44 +1869,36 @@ class ProcInfo(CommonFormattingBase):
         -------
         >>> proc = ProcInfo(args)
         >>> proc._console("[INFO]", "This is an info message.", lvl=1)
+        >>> proc._console("[INFO]", "Read %d lines from '%s'.", lvl=1, args=(10, "example.txt"))
 
         Notes
         -----
-        - If the message is a list, the method recursively processes each item in the list.
+        - If the message is a list, each item is written as its own line, all in a single write.
         - Messages are only printed if the verbosity level is sufficient.
         - The method handles whether the console output is directed to a progress bar or a regular console.
         """
         if not ProcInfo._logger:
             self._init_logger()
-            pass  # for auto-indentation
-        if isinstance(msg, list):
-            for m in msg:
-                self._console(prefix, m, lvl)
-                pass  # for auto-indentation
+        if not (self._to_stdout and lvl <= self._verbosity):
             return self
-        if self._to_stdout and lvl <= self._verbosity:
-            if self._prefix_console:
-                prefix = f"{prefix} {self.coarse_elapsed_td}: "
-            elif prefix:
-                prefix = f"{prefix}: "
-            else:
-                prefix = ""
-                pass  # for auto-indentation
-            if self.has_bar:
-                if msg.endswith("\n"):
-                    self._console_fh.write(f"{prefix}{msg}", end="")
-                else:
-                    self._console_fh.write(f"{prefix}{msg}", end="\n")
-                    pass  # for auto-indentation
-            else:
-                if msg.endswith("\n"):
-                    self._console_fh.write(f"{prefix}{msg}")
-                else:
-                    self._console_fh.write(f"{prefix}{msg}\n")
-                    pass  # for auto-indentation
-                self._console_fh.flush()
-                pass  # for auto-indentation
-            pass  # for auto-indentation
+        if args:
+            try:
+                msg = [m % args for m in msg] if isinstance(msg, list) else msg % args
+            except (TypeError, ValueError, KeyError):
+                pass  # Badly formatted call; print the raw message rather than crash, as logging would
+        spaced, coloned = ProcInfo._console_prefix_variants(prefix)
+        if self._prefix_console:
+            prefix = "".join((spaced, self._coarse_elapsed_str(), ": "))
+        else:
+            prefix = coloned
+        if isinstance(msg, list):
+            # One write for all of the lines rather than one per line.
+            line = "".join([f"{prefix}{m}" if m.endswith("\n") else f"{prefix}{m}\n" for m in msg])
+            if not line:
+                return self
+        else:
+            line = "".join((prefix, msg, "" if msg.endswith("\n") else "\n"))
+        self._write_line(line)
         return self
 
     def info_table(self, table: 'unitable.Unitable', *args, lvl: int = 1, **kwargs) -> ProcInfoT:
@@ -1500,13 +1935,12 @@ class ProcInfo(CommonFormattingBase):
 
         Notes
         -----
-        - The method splits the table content into lines and logs each line separately.
+        - The method splits the table content into lines, writes them to the console at once and logs each line separately.
         - The verbosity level controls whether the table content is logged based on the configured verbosity.
         """
-        for line in table.draw().splitlines():
-            self.info(f"{line}", *args, lvl=lvl, **kwargs)
-            pass  # for auto-indentation
-        return self
+        if lvl > self._max_console_lvl and not self._file_logs(logging.INFO):
+            return self
+        return self._do_output(self._info_prefix, True, lvl, self._log_info, table.draw().splitlines(), *args, **kwargs)
 
     def _do_output(self, console_prefix: str, to_console: bool, console_level: int, logger_func: Callable, msg: int, *args, **kwargs) -> ProcInfoT:
         """
@@ -1543,12 +1977,58 @@ class ProcInfo(CommonFormattingBase):
         >>> proc = ProcInfo(args)
         >>> proc._do_output("[INFO]", True, 1, proc.logger.info, "This is an info message.")
         """
+        if ProcInfo._logger is None:
+            self._init_logger()
+        if to_console:
+            self._console(console_prefix, msg, lvl=console_level, args=args)
+        if self._log_to_file:
+            if isinstance(msg, list):
+                for line in msg:
+                    logger_func(line, *args, **kwargs)
+            else:
+                logger_func(msg, *args, **kwargs)
+        return self
+
+    def _do_output_fast(self, console_prefix: str, to_console: bool, console_level: int, logger_func: Callable, msg: str) -> ProcInfoT:
+        """
+        Handle output to console and log file for a message without extra arguments.
+
+        This is `_do_output` without the `*args` and `**kwargs` packing and unpacking,
+        for the common case of a plain (already formatted) message.
+
+        Parameters
+        ----------
+        console_prefix : str
+            The prefix to prepend to the console message.
+        to_console : bool
+            Flag indicating whether to print the message to the console.
+        console_level : int
+            The verbosity level for console output.
+        logger_func : Callable
+            The logging function to use for logging the message.
+        msg : str
+            The message to log.
+
+        Returns
+        -------
+        ProcInfoT
+            Returns the instance of ProcInfo to allow for method chaining.
+
+        Example
+        -------
+        >>> proc = ProcInfo(args)
+        >>> proc._do_output_fast("[INFO]", True, 1, proc.logger.info, "This is an info message.")
+        """
+        if ProcInfo._logger is None:
+            self._init_logger()
         if to_console:
-            self._console(console_prefix, msg, lvl=console_level)
-            pass  # for auto-indentation
+            self._console(console_prefix, msg, console_level)
         if self._log_to_file:
-            logger_func(msg, *args, **kwargs)
-            pass  # for auto-indentation
+            if isinstance(msg, list):
+                for line in msg:
+                    logger_func(line)
+            else:
+                logger_func(msg)
         return self
 
     def debug(self, msg: str, *args, lvl: int = 1, **kwargs) -> ProcInfoT:
@@ -1579,7 +2059,11 @@ class ProcInfo(CommonFormattingBase):
         >>> proc = ProcInfo(args)
         >>> proc.debug("This is a debug message.", lvl=2)
         """
-        return self._do_output(self._debu_prefix, self._debug, lvl, self.logger.debug, msg, *args, **kwargs)
+        if (lvl > self._max_console_lvl or not self._debug) and not self._file_logs(logging.DEBUG):
+            return self
+        if not args and not kwargs:
+            return self._do_output_fast(self._debu_prefix, self._debug, lvl, self._log_debug, msg)
+        return self._do_output(self._debu_prefix, self._debug, lvl, self._log_debug, msg, *args, **kwargs)
 
     def info(self, msg: str, *args, lvl: int = 1, **kwargs) -> ProcInfoT:
         """
@@ -1609,7 +2093,11 @@ class ProcInfo(CommonFormattingBase):
         >>> proc = ProcInfo(args)
         >>> proc.info("This is an info message.", lvl=1)
         """
-        return self._do_output(self._info_prefix, True, lvl, self.logger.info, msg, *args, **kwargs)
+        if lvl > self._max_console_lvl and not self._file_logs(logging.INFO):
+            return self
+        if not args and not kwargs:
+            return self._do_output_fast(self._info_prefix, True, lvl, self._log_info, msg)
+        return self._do_output(self._info_prefix, True, lvl, self._log_info, msg, *args, **kwargs)
 
     def print(self, msg: str, *args, lvl: int = 1, **kwargs) -> ProcInfoT:
         """
@@ -1639,7 +2127,11 @@ class ProcInfo(CommonFormattingBase):
         >>> proc = ProcInfo(args)
         >>> proc.print("This is a print message.", lvl=1)
         """
-        return self._do_output("", True, lvl, self.logger.info, msg, *args, **kwargs)
+        if lvl > self._max_console_lvl and not self._file_logs(logging.INFO):
+            return self
+        if not args and not kwargs:
+            return self._do_output_fast("", True, lvl, self._log_info, msg)
+        return self._do_output("", True, lvl, self._log_info, msg, *args, **kwargs)
 
     def warning(self, msg: str, *args: argparse.Namespace, lvl: int = -999, **kwargs) -> 'ProcInfo':
         """
@@ -1672,18 +2164,17 @@ class ProcInfo(CommonFormattingBase):
         """
         self._warning_count += 1
         if self._max_warning_count and self._warning_count >= self._max_warning_count:
-            self._do_output(self._warn_prefix, True, lvl, self.logger.warning, msg, *args, **kwargs)
+            self._do_output(self._warn_prefix, True, lvl, self._log_warning, msg, *args, **kwargs)
             if self._max_error_count:
                 self.err(f"There {'was' if self._error_count == 1 else 'were'} {self._error_count:,d} "
                          f"errors ({self._max_error_count:,d} was the maximum).")
             else:
                 self.err(f"There {'was' if self._error_count == 1 else 'were'} {self._error_count:,d} "
                          f"errors (There was no the maximum).")
-                pass  # for auto-indentation
             self.fatal(f"There {'was' if self._warning_count == 1 else 'were'} {self._warning_count:,d} "
                        f"warnings which exceeds the maximum number of allowed warnings.")
             return self
-        return self._do_output(self._warn_prefix, True, lvl, self.logger.warning, msg, *args, **kwargs)
+        return self._do_output(self._warn_prefix, True, lvl, self._log_warning, msg, *args, **kwargs)
 
     warn = warning
 
@@ -1718,18 +2209,17 @@ class ProcInfo(CommonFormattingBase):
         """
         self._error_count += 1
         if self._max_error_count and self._error_count >= self._max_error_count:
-            self._do_output(self._erro_prefix, True, lvl, self.logger.error, msg, *args, **kwargs)
+            self._do_output(self._erro_prefix, True, lvl, self._log_error, msg, *args, **kwargs)
             if self._max_warning_count:
                 self.err(f"There {'was' if self._warning_count == 1 else 'were'} {self._warning_count:,d} "
                          f"warnings ({self._max_warning_count:,d} was the maximum).")
             else:
                 self.err(f"There {'was' if self._warning_count == 1 else 'were'} {self._warning_count:,d} "
                          f"warnings (There was no the maximum).")
-                pass  # for auto-indentation
             self.fatal(f"There {'was' if self._error_count == 1 else 'were'} {self._error_count:,d} "
                        f"errors which exceeds the maximum number of allowed errors.")
             return self
-        return self._do_output(self._erro_prefix, True, lvl, self.logger.error, msg, *args, **kwargs)
+        return self._do_output(self._erro_prefix, True, lvl, self._log_error, msg, *args, **kwargs)._flush_console()
 
     err = error
 
@@ -1764,7 +2254,7 @@ class ProcInfo(CommonFormattingBase):
         """
         self._error_count += 1
         self._critical_count += 1
-        return self._do_output(self._crit_prefix, True, lvl, self.logger.critical, msg, *args, **kwargs)
+        return self._do_output(self._crit_prefix, True, lvl, self._log_critical, msg, *args, **kwargs)._flush_console()
 
     def fatal(self, msg: str, exception: Exception = None, *args, lvl: int = -999, **kwargs) -> ProcInfoT:
         """
@@ -1797,6 +2287,7 @@ class ProcInfo(CommonFormattingBase):
         -------
         >>> proc = ProcInfo(args)
         >>> proc.fatal("This is a fatal error message.", lvl=1)
+        >>> proc.fatal("Command '%s' failed with return code %d", None, "false", 1)
 
         Notes
         -----
@@ -1805,7 +2296,7 @@ class ProcInfo(CommonFormattingBase):
         """
         self._error_count += 1
         self._critical_count += 1
-        self._do_output(self._fata_prefix, True, lvl, self.logger.critical, msg, *args, **kwargs)
+        self._do_output(self._fata_prefix, True, lvl, self._log_critical, msg, *args, **kwargs)._flush_console()
         if exception:
             raise exception
         return sys.exit(1)
@@ -1833,8 +2324,8 @@ class ProcInfo(CommonFormattingBase):
         - If there were no errors, the method returns None.
         """
         if self._error_count > 0:
-            errs = 's' if self._error_count > 1 else ''
-            warns = 's' if self._warning_count > 1 else ''
+            errs = 's'[self._error_count <= 1:]  # '' for a single error, 's' otherwise
+            warns = 's'[self._warning_count <= 1:]
             return self.fatal(f"There were {self._error_count:,d} error{errs} and "
                               f"{self._warning_count:,d} warning{warns}. Exiting.")
         return None
@@ -1873,7 +2364,7 @@ class ProcInfo(CommonFormattingBase):
         """
         self._error_count += 1
         self._critical_count += 1
-        return self._do_output(self._exep_prefix, True, lvl, self.logger.error, msg, *args, **kwargs)
+        return self._do_output(self._exep_prefix, True, lvl, self._log_error, msg, *args, **kwargs)._flush_console()
 
     def _append_dirs(self, arr, basedir, dirnames):
         """
@@ -1899,10 +2390,12 @@ class ProcInfo(CommonFormattingBase):
         >>> print(dirs)
         ['/base/dir1', '/base/dir2']
         """
-        for dirname in dirnames:
-            arr.append(os.path.join(basedir, dirname))
-            pass  # for auto-indentation
-        pass  # for auto-indentation
+        if not basedir or basedir.endswith(os.sep):
+            prefix = basedir
+        else:
+            prefix = basedir + os.sep
+        # Joined once above; an absolute dirname still replaces basedir, as with os.path.join().
+        arr.extend(dirname if os.path.isabs(dirname) else prefix + dirname for dirname in dirnames)
 
     def get_config_file(self, search_path=None, filenames=None):
         """
@@ -1937,36 +2430,39 @@ class ProcInfo(CommonFormattingBase):
 
         Notes
         -----
-        - The default search path includes the current working directory, the user home directory,
+        - The default search path includes the working directory when this ProcInfo was created, the user home directory,
           the ".config" directory in the user home directory, and the current script directory.
         - The default filenames include variations of the script basename with extensions such as
           ".conf", ".cfg", and ".config".
-        """
-        if self._config_file is not None:
-            return self._config_file
+        - The result of the default lookup (search_path and filenames both None), found or not, is
+          remembered, so later calls do not search again.
+        """
+        use_defaults = search_path is None and filenames is None
+        if use_defaults:
+            if self._config_file is not None:
+                return self._config_file
+            if self._config_file_missing:
+                return None
         if search_path is None:
             search_path = SearchPath()
             search_path.required_perms = stat.S_IRUSR
-            search_path.auto_append_dirs([".config", ".conf", ".cfg",
-                                          "config", "conf", "cfg"])
-            cwd = os.getcwd()
-            search_path.append(cwd)
-            if cwd != self.START_WORKING_DIRECTORY:
-                search_path.append(self.START_WORKING_DIRECTORY)
-                pass  # for auto-indentation
-            homedir = os.path.expanduser("~")
-            search_path.append(homedir)
+            search_path.auto_append_dirs = [".config", ".conf", ".cfg",
+                                            "config", "conf", "cfg"]
+            start_dir = self.START_WORKING_DIRECTORY
+            search_path.append(self._cwd)
+            if self._cwd != start_dir:
+                search_path.append(start_dir)
+            search_path.append(self._homedir)
             search_path.append(self.MAIN_DIRNAME)
         if filenames is None:
             bname = self.main_basename
-            filenames = [
-                f"{bname}", f".{bname}",
-                f".{bname}.cfg", f"{bname}.cfg",
-                f".{bname}.conf", f"{bname}.conf",
-                f".{bname}.config", f"{bname}.config",
-            ]
-            pass  # for auto-indentation
-        return search_path.find_first(filenames)
+            filenames = [pattern.format(b=bname) for pattern in self._CONFIG_PATTERNS]
+        config_file = search_path.find_first(filenames)
+        if use_defaults:
+            # Only the default lookup is remembered; explicit arguments may ask for something else.
+            self._config_file = config_file
+            self._config_file_missing = config_file is None
+        return config_file
 
     def backup(self, filename):
         """
@@ -2001,11 +2497,13 @@ class ProcInfo(CommonFormattingBase):
         - The method generates a unique filename with a '.bu' extension and renames
           the original file to the new filename.
         """
-        if not os.path.exists(filename):
-            raise FileNotFoundError(f"Cannot backup '{filename}' since it does not exist.")
         new_filename = self.get_unique_filename(extension='bu', basename=filename)
+        try:
+            os.replace(filename, new_filename)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Cannot backup '{filename}' since it does not exist.") from None
         self.info(f"Backing up previous '{filename}' to '{new_filename}'.")
-        return os.rename(filename, new_filename)
+        return new_filename
 
     def open(self, filename, mode='r', backup_before_overwrite=True, **kwargs):
         """
@@ -2051,32 +2549,31 @@ class ProcInfo(CommonFormattingBase):
         - If the mode is read-only and the file does not exist, it logs a fatal error
           and exits the process.
         """
-        if mode in {"r", "rb", "r+", "rb+", "rt", "rt+"}:
+        if mode in _READ_MODES:
             self.info(f"Opening file '{filename}' with mode '{mode}'.")
             try:
                 return open(filename, mode=mode, **kwargs)
             except FileNotFoundError as err:
                 self.fatal(f"Unable to open '{filename}' with mode '{mode}': no such file or directory.",
                            exception=err)
-                sys.exit(1)
-                pass  # for auto-indentation
-        if os.path.exists(filename) and not os.path.isfile(filename):
+        try:
+            file_stat = os.stat(filename)
+        except (OSError, ValueError):  # Treated as missing, like os.path.exists() does
+            file_stat = None
+        if file_stat is not None and not stat.S_ISREG(file_stat.st_mode):
             raise ValueError(f"'{filename}' is not a regular file, so I can't open it with mode '{mode}'.")
-        if mode not in {"w", "wb", "w+", "wb+", "wt", "wt+", "a", "ab", "a+", "ab+", "at", "at+"}:
+        if mode not in _WRITE_MODES and mode not in _APPEND_MODES:
             raise ValueError(f"Do not understand mode '{mode}', so I can't open '{filename}' for you.")
-        if not os.path.exists(filename):
+        if file_stat is None:
             self.info(f"Creating new file '{filename}' using mode '{mode}'.")
             return open(filename, mode=mode, **kwargs)
-        elif mode in {"w", "wb", "w+", "wb+", "wt", "wt+"}:
+        elif mode in _WRITE_MODES:
             if backup_before_overwrite:
                 self.backup(filename)
-                pass  # for auto-indentation
             else:
                 self.warn(f"Overwriting file '{filename}' using mode '{mode}'.")
-                pass  # for auto-indentation
-        elif mode in {"a", "ab", "a+", "ab+", "at", "at+"}:
+        elif mode in _APPEND_MODES:
             self.info(f"Appending to '{filename}' using mode '{mode}'.")
-            pass  # for auto-indentation
         return open(filename, mode=mode, **kwargs)
 
     def Popen(self, cmd_args, **kwargs):
@@ -2107,14 +2604,14 @@ class ProcInfo(CommonFormattingBase):
         Notes
         -----
         - The method logs the command string before running it.
-        - If cmd_args is a string, it is split into arguments using shlex.split().
+        - If cmd_args is a string, it is split into arguments as shlex.split() would; pass a list to skip this.
         """
         if isinstance(cmd_args, str):
-            cmd_args = shlex.split(cmd_args)
-            pass  # for auto-indentation
-        cmd_str = "'" + "' '".join(cmd_args) + "'"
-        self.info(f"Running: {cmd_str}")
-        self._last_subprocess = subprocess.Popen(cmd_args, **kwargs)
+            cmd_args = _split_command(cmd_args)
+        if self._should_log_info():
+            self.info(f"Running: {shlex.join(cmd_args)}")
+        self._flush_console()  # So our output comes before the command's
+        self._last_subprocess = _Popen(cmd_args, **kwargs)
         return self._last_subprocess
 
     run = Popen
@@ -2150,15 +2647,16 @@ class ProcInfo(CommonFormattingBase):
         - If the command exits with a non-zero status, it logs an error or fatal message
           based on the fatal_on_fail flag.
         """
-        self.info("Running:")
-        self.info(f"{' '.join(cmd)}")
-        proc = subprocess.run(cmd)
+        if self._should_log_info():
+            self.info("Running:")
+            self.info(shlex.join(cmd))
+        self._flush_console()  # So our output comes before the command's
+        proc = _run(cmd)
         if proc.returncode != 0:
             if fatal_on_fail:
                 self.fatal(f"The {cmd[0]} command exited abnormally with exit code {proc.returncode}. Cannot continue.")
             else:
                 self.warn(f"The {cmd[0]} command exited abnormally with exit code {proc.returncode}.")
-            pass  # for auto-indentation
         return proc
 
     def run_proc(self, cmd_args, log_stdout=False, log_stderr=None, fail_fatal=True,
@@ -2229,14 +2727,15 @@ class ProcInfo(CommonFormattingBase):
 
         Returns
         -------
-        subprocess.CompletedProcess
-            The CompletedProcess instance.
+        subprocess.Popen
+            The Popen instance of the finished command. Unless its output was logged, any
+            stdout/stderr pipes the caller asked for can still be read from it.
 
         Example
         -------
         >>> proc = ProcInfo(args)
         >>> result = proc.run_proc(["ls", "-l"], log_stdout=True)
-        >>> print(result.stdout)
+        >>> print(result.returncode)
 
         Notes
         -----
@@ -2246,18 +2745,20 @@ class ProcInfo(CommonFormattingBase):
           logs a critical error and exits the process.
         """
         if isinstance(cmd_args, str):
-            cmd_args = shlex.split(cmd_args)
+            cmd_args = _split_command(cmd_args)
 
-        self.info(f"Running command: {' '.join(cmd_args)}")
+        if self._should_log_info():
+            self.info(f"Running command: {shlex.join(cmd_args)}")
 
         if log_stderr is None:
             log_stderr = log_stdout
 
         if log_stdout or log_stderr:
-            stdout = subprocess.PIPE if log_stdout else stdout
-            stderr = subprocess.PIPE if log_stderr else stderr
+            stdout = _PIPE if log_stdout else stdout
+            stderr = _PIPE if log_stderr else stderr
 
-        proc = subprocess.Popen(
+        self._flush_console()  # So our output comes before the command's
+        proc = _Popen(
             cmd_args,
             bufsize=bufsize,
             executable=executable,
@@ -2291,9 +2792,9 @@ class ProcInfo(CommonFormattingBase):
 
         if proc.returncode != 0:
             if fail_fatal:
-                self.fatal(f"Command '{' '.join(cmd_args)}' failed with return code {proc.returncode}")
+                self.fatal("Command '%s' failed with return code %d", None, shlex.join(cmd_args), proc.returncode)
             else:
-                self.warn(f"Command '{' '.join(cmd_args)}' failed with return code {proc.returncode}")
+                self.warn("Command '%s' failed with return code %d", shlex.join(cmd_args), proc.returncode)
 
         return proc
 
@@ -2357,26 +2858,14 @@ class ProcInfo(CommonFormattingBase):
         """
         if not hasattr(cls, '_parser') or not cls._parser:
             raise ValueError(f"Must set argparse parser using {cls.__name__}.set_argparse_parser() before calling this method.")
-            pass  # for auto-indentation
-
-        yes_args, no_args, first_arg_name = [], [], None
-        for arg in args:
-            if first_arg_name is None:
-                first_arg_name = arg
-                pass  # for auto-indentation
-            if arg.startswith("-"):
-                # -foo becomes --foo and --no-foo
-                yes, no = "-" + arg, "--no" + arg
-            else:
-                # foo becomes -foo and -nofoo
-                yes, no = "-" + arg, "-no" + arg
-                pass  # for auto-indentation
-            yes_args.append(yes)
-            no_args.append(no)
+
+        first_arg_name = args[0]
+        # -foo becomes --foo and --no-foo, foo becomes -foo and -nofoo
+        yes_args = ["-" + arg for arg in args]
+        no_args = ["--no" + arg if arg.startswith("-") else "-no" + arg for arg in args]
 
         parser = cls._parser
-        desc_yes = desc.split(" ", 1)
-        desc_yes = desc_yes[0].capitalize() + ' ' + desc_yes[1] if len(desc_yes) > 1 else desc.capitalize()
+        desc_yes = desc[:1].upper() + desc[1:]
         desc_no = "Don't " + desc
 
         parser.add_argument(
@@ -2397,12 +2886,8 @@ class ProcInfo(CommonFormattingBase):
         first_arg_name = first_arg_name[1:] if first_arg_name.startswith("-") else first_arg_name
         if first_arg_name in cls._toggle_args:
             raise ValueError(f"Duplicate arg '{first_arg_name}' encountered.")
-            pass  # for auto-indentation
 
         cls._toggle_args[first_arg_name] = {'desc': desc_yes, 'dest': dest}
-        pass  # for auto-indentation
-
-    pass  # for auto-indentation for class definition
 
 
 def _main():
@@ -2445,7 +2930,6 @@ def _main():
         proc.warn("This is a warning.")
         proc.err("This is an error.")
         proc.debug("This is a debug message.")
-        pass  # for auto-indentation
 
     if args.test_fbar:
         pass  # for auto-indentation
@@ -2455,6 +2939,5 @@ def _main():
 
 if __name__ == "__main__":
     sys.exit(_main())
-    pass  # for auto-indentation
 
 # End
@@ -1,12 +1,107 @@
 """A module with stoff for terminals."""
 
 # import tty
+import os
 import sys
-import re
+import contextlib
+
+# Parameterized CSI sequences ("\033[<n><code>") keyed by (code, n). Redraw
+# loops mostly move by small amounts, so those are built once up front and
+# anything else is formatted and remembered on first use, up to a bound like
+# _POS_CACHE below.
+_SEQ_CACHE = {
+    (code, num): f"\033[{num}{code}" for code in "ABCDEFGST" for num in range(1, 64)
+}
+_SEQ_CACHE_MAX = 4096
+
+# Absolute positioning sequences keyed by (line, col, code). Bounded so that
+# programs addressing arbitrary positions do not grow it without limit;
+# 4096 covers every cell of an 80x50 screen.
+_POS_CACHE = {}
+_POS_CACHE_MAX = 4096
+
+# CSI sequences as written by Term (colors, moves, clears, cursor visibility).
+# Compiled by strip_ansi() on first use so that importing this module for the
+# constants does not pull in re.
+_ANSI_PATTERN = r"\x1b\[[0-9;?]*[A-Za-z]"
+_ANSI_RE = None
+
+
+def _seq(code, num):
+    """Return the CSI sequence ``"\\033[<num><code>"``, cached per (code, num)."""
+    key = (code, num)
+    seq = _SEQ_CACHE.get(key)
+    if seq is None:
+        seq = f"\033[{num}{code}"
+        if len(_SEQ_CACHE) < _SEQ_CACHE_MAX:
+            _SEQ_CACHE[key] = seq
+    return seq
+
+
+def _pos(line, col, code):
+    """Return the CSI sequence ``"\\033[<line>;<col><code>"``, cached per position."""
+    key = (line, col, code)
+    seq = _POS_CACHE.get(key)
+    if seq is None:
+        seq = f"\033[{line};{col}{code}"
+        if len(_POS_CACHE) < _POS_CACHE_MAX:
+            _POS_CACHE[key] = seq
+    return seq
+
+
+def _read_cpr(fd, timeout):
+    """
+    Read a cursor position report from fd and return (line, col).
+
+    fd must already be in cbreak (or raw) mode and the "\\x1b[6n" query sent.
+
+    Returns
+    -------
+    tuple or None
+        None when nothing arrives within timeout seconds, or when the reply
+        is not a well-formed "\\x1b[<line>;<col>R" (e.g. a keystroke snuck in).
+
+    """
+    import select
+    buf = b""
+    # The reply usually arrives in one piece, so wait for fd to become
+    # readable and take everything available in one read.
+    while not buf.endswith(b"R"):
+        if not select.select([fd], [], [], timeout)[0]:
+            break
+        chunk = os.read(fd, 64)
+        if not chunk:
+            break
+        buf += chunk
+    if not (buf.startswith(b"\x1b[") and buf.endswith(b"R")):
+        return None
+    try:
+        line, col = buf[2:-1].split(b";", 1)
+        return (int(line), int(col))
+    except ValueError:
+        return None
 
 
 class Term:
-    """Constants for TERM colors."""
+    """
+    Constants for TERM colors.
+
+    The upper-case class attributes (RED, BLUE_BG, UP, CL, ...) are the
+    canonical escape sequences; the lower-case methods just write them to
+    output_fh and return self so calls can be chained.
+
+    Notes
+    -----
+    Each method call costs a Python call plus a write (and by default a
+    flush). Where that matters, build the line from the constants and write
+    it once, or wrap the redraw in batch().
+
+    Example
+    -------
+    >>> sys.stdout.write(Term.RED + "failed" + Term.NORMAL + "\\n")
+    >>> Term().red().write("failed").normal()
+
+    """
 
     NORMAL = "\033[0m"
     # Standard colors
@@ -51,6 +146,18 @@ class Term:
     DOWN = "\033[B"
     RIGHT = "\033[C"
     LEFT = "\033[D"
+    # The num=1 forms of the parameterized moves, by far the most common.
+    # The horizontal ones are named after their codes, CUF (cursor forward, "C")
+    # and CUB (cursor back, "D"), since left() emits C and right() emits D.
+    _UP1 = "\033[1A"
+    _DOWN1 = "\033[1B"
+    _CUF1 = "\033[1C"
+    _CUB1 = "\033[1D"
+    _PREV1 = "\033[1E"
+    _NEXT1 = "\033[1F"
+    _COL1 = "\033[1G"
+    _PGUP1 = "\033[1S"
+    _PGDN1 = "\033[1T"
     # Visibility
     HIDE_CURSOR = "\033[?25l"
     SHOW_CURSOR = "\033[?25h"
@@ -61,112 +168,206 @@ class Term:
     CL_EOL = "\033[K"
     CL_BOL = "\033[1K"
     CL = "\033[2K"
+    # Prefix/suffix pairs for get_colored(), keyed by color method name.
+    _COLOR_WRAP = {
+        "black": (BLACK, NORMAL),
+        "black_bg": (BLACK_BG, NORMAL),
+        "black_bright": (BLACK_BRIGHT, NORMAL),
+        "black_bright_bg": (BLACK_BRIGHT_BG, NORMAL),
+        "blue": (BLUE, NORMAL),
+        "blue_bg": (BLUE_BG, NORMAL),
+        "blue_bright": (BLUE_BRIGHT, NORMAL),
+        "blue_bright_bg": (BLUE_BRIGHT_BG, NORMAL),
+        "cyan": (CYAN, NORMAL),
+        "cyan_bg": (CYAN_BG, NORMAL),
+        "cyan_bright": (CYAN_BRIGHT, NORMAL),
+        "cyan_bright_bg": (CYAN_BRIGHT_BG, NORMAL),
+        "green": (GREEN, NORMAL),
+        "green_bg": (GREEN_BG, NORMAL),
+        "green_bright": (GREEN_BRIGHT, NORMAL),
+        "green_bright_bg": (GREEN_BRIGHT_BG, NORMAL),
+        "magenta": (MAGENTA, NORMAL),
+        "magenta_bg": (MAGENTA_BG, NORMAL),
+        "magenta_bright": (MAGENTA_BRIGHT, NORMAL),
+        "magenta_bright_bg": (MAGENTA_BRIGHT_BG, NORMAL),
+        "red": (RED, NORMAL),
+        "red_bg": (RED_BG, NORMAL),
+        "red_bright": (RED_BRIGHT, NORMAL),
+        "red_bright_bg": (RED_BRIGHT_BG, NORMAL),
+        "white": (WHITE, NORMAL),
+        "white_bg": (WHITE_BG, NORMAL),
+        "white_bright": (WHITE_BRIGHT, NORMAL),
+        "white_bright_bg": (WHITE_BRIGHT_BG, NORMAL),
+        "yellow": (YELLOW, NORMAL),
+        "yellow_bg": (YELLOW_BG, NORMAL),
+        "yellow_bright": (YELLOW_BRIGHT, NORMAL),
+        "yellow_bright_bg": (YELLOW_BRIGHT_BG, NORMAL),
+    }
 
     def __init__(self, args=None, output_fh=sys.stdout):
         self.args = args
         self.output_fh = output_fh
+        self._buf = None
+        pass
+
+    @property
+    def output_fh(self):
+        """The file object everything is written to."""
+        return self._output_fh
+
+    @output_fh.setter
+    def output_fh(self, output_fh):
+        # write() runs for every escape sequence, so keep the bound methods
+        # rather than looking them up on the file object each time.
+        self._output_fh = output_fh
+        self._write = output_fh.write
+        self._flush = output_fh.flush
+        try:
+            self._fd = output_fh.fileno()
+        except (AttributeError, OSError, ValueError):
+            # StringIO and friends have no descriptor (io.UnsupportedOperation
+            # is an OSError).
+            self._fd = None
+        # Only a terminal needs to see every sequence as soon as it is
+        # written; pipes and files are left to the stream's own buffering.
+        try:
+            self._is_tty = self._fd is not None and os.isatty(self._fd)
+        except OSError:
+            self._is_tty = False
         pass
 
-    def write(self, what, flush=True):
-        self.output_fh.write(what)
-        if flush:
-            self.output_fh.flush()
+    def _write_bytes(self, what):
+        """Write bytes, straight to the descriptor when there is one."""
+        if self._fd is None:
+            self._write(what.decode("utf-8", "replace"))
+            return
+        # Anything already queued in the text layer has to go out first.
+        self._flush()
+        view = memoryview(what)
+        while view:
+            view = view[os.write(self._fd, view):]
+            pass
+        pass
+
+    def write(self, what, flush=None):
+        """
+        Write what to output_fh.
+
+        flush=True and flush=False force or skip the flush; the default None
+        flushes only when output_fh is a TTY.
+
+        what may also be bytes (e.g. pre-encoded escape sequences). When
+        output_fh has a file descriptor those are handed to os.write() as is,
+        skipping the text layer's encoding; otherwise they are decoded as
+        UTF-8 and written as text.
+
+        """
+        if type(what) is not str and isinstance(what, (bytes, bytearray)):
+            if self._buf is not None:
+                self._buf.append(what.decode("utf-8", "replace"))
+                return self
+            self._write_bytes(what)
+            return self
+        if self._buf is not None:
+            self._buf.append(what)
+            return self
+        self._write(what)
+        if flush or (flush is None and self._is_tty):
+            self._flush()
             pass
         return self
 
-    def up(self, num=1): return self.write(f"\033[{num}A")
-    def down(self, num=1): return self.write(f"\033[{num}B")
-    def left(self, num=1): return self.write(f"\033[{num}C")
-    def right(self, num=1): return self.write(f"\033[{num}D")
-    def prev_line(self, num=1): return self.write(f"\033[{num}E")
-    def next_line(self, num=1): return self.write(f"\033[{num}F")
-    def col(self, num=1): return self.write(f"\033[{num}G")
-    def abs_pos(self, line=1, col=1): return self.write(f"\033[{line};{col}H")
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Collect everything written inside the block and emit it at once.
+
+        On a TTY every write() goes straight to output_fh and flushes, which is
+        one syscall per escape sequence. Inside ``with term.batch():`` writes
+        are only appended to a list, and a single write+flush of the joined
+        text happens on exit (also when the block raises). Nested batches
+        fold into the outermost one.
+
+        Example
+        -------
+        >>> with term.batch():
+        ...     term.up().cl().green().write("done").normal()
+
+        """
+        if self._buf is not None:
+            yield self
+            return
+        self._buf = []
+        try:
+            yield self
+        finally:
+            buf, self._buf = self._buf, None
+            if buf:
+                self._write("".join(buf))
+                self._flush()
+                pass
+            pass
+        pass
+
+    def up(self, num=1): return self.write(Term._UP1 if num == 1 else _seq("A", num))
+    def down(self, num=1): return self.write(Term._DOWN1 if num == 1 else _seq("B", num))
+    def left(self, num=1): return self.write(Term._CUF1 if num == 1 else _seq("C", num))
+    def right(self, num=1): return self.write(Term._CUB1 if num == 1 else _seq("D", num))
+    def prev_line(self, num=1): return self.write(Term._PREV1 if num == 1 else _seq("E", num))
+    def next_line(self, num=1): return self.write(Term._NEXT1 if num == 1 else _seq("F", num))
+    def col(self, num=1): return self.write(Term._COL1 if num == 1 else _seq("G", num))
+    def abs_pos(self, line=1, col=1): return self.write(_pos(line, col, "H"))
     def cs_eof(self): return self.write("\033[J")
     def cs_bof(self): return self.write("\033[1J")
     def cs(self): return self.write("\033[2J")
     def cl_eol(self): return self.write("\033[K")
     def cl_bol(self): return self.write("\033[1K")
     def cl(self): return self.write("\033[2K")
-    def page_up(self, num=1): return self.write(f"\033[{num}S")
-    def page_down(self, num=1): return self.write(f"\033[{num}T")
-    def goto(self, line=1, col=1): return self.write(f"\033[{line};{col}f")
-    def red(self): return self.write("\033[30m")
-    def normal(self): return self.write("\033[0m")
-    def black(self): return self.write("\033[30m")
-    def black_bg(self): return self.write("\033[40m")
-    def black_bright(self): return self.write("\033[30;1m")
-    def black_bright_bg(self): return self.write("\033[40;1m")
-    def blue(self): return self.write("\033[34m")
-    def blue_bg(self): return self.write("\033[44m")
-    def blue_bright(self): return self.write("\033[34;1m")
-    def blue_bright_bg(self): return self.write("\033[44;1m")
-    def cyan(self): return self.write("\033[36m")
-    def cyan_bg(self): return self.write("\033[46m")
-    def cyan_bright(self): return self.write("\033[36;1m")
-    def cyan_bright_bg(self): return self.write("\033[46;1m")
-    def green(self): return self.write("\033[32m")
-    def green_bg(self): return self.write("\033[42m")
-    def green_bright(self): return self.write("\033[32;1m")
-    def green_bright_bg(self): return self.write("\033[42;1m")
-    def magenta(self): return self.write("\033[35m")
-    def magenta_bg(self): return self.write("\033[45m")
-    def magenta_bright(self): return self.write("\033[35;1m")
-    def magenta_bright_bg(self): return self.write("\033[45;1m")
-    def red(self): return self.write("\033[31m")
-    def red_bg(self): return self.write("\033[41m")
-    def red_bright(self): return self.write("\033[31;1m")
-    def red_bright_bg(self): return self.write("\033[41;1m")
-    def white(self): return self.write("\033[37m")
-    def white_bg(self): return self.write("\033[47m")
-    def white_bright(self): return self.write("\033[37;1m")
-    def white_bright_bg(self): return self.write("\033[47;1m")
-    def yellow(self): return self.write("\033[33m")
-    def yellow_bg(self): return self.write("\033[43m")
-    def yellow_bright(self): return self.write("\033[33;1m")
-    def yellow_bright_bg(self): return self.write("\033[43;1m")
-    def hide_cursor(self): return self.write("\033[?25l")
-    def show_cursor(self): return self.write("\033[?25h")
+    def page_up(self, num=1): return self.write(Term._PGUP1 if num == 1 else _seq("S", num))
+    def page_down(self, num=1): return self.write(Term._PGDN1 if num == 1 else _seq("T", num))
+    def goto(self, line=1, col=1): return self.write(_pos(line, col, "f"))
+    def hide_cursor(self): return self.write(Term.HIDE_CURSOR)
+    def show_cursor(self): return self.write(Term.SHOW_CURSOR)
 
     @staticmethod
     def get_cursor_up(num=1):
         """Get string to move the cursor up num or 1 lines."""
-        return f"\033[{num}A"
+        return Term._UP1 if num == 1 else _seq("A", num)
 
     @staticmethod
     def get_cursor_down(num=1):
         """Get string to move the cursor down num or 1 lines."""
-        return f"\033[{num}B"
+        return Term._DOWN1 if num == 1 else _seq("B", num)
 
     @staticmethod
     def get_cursor_right(num=1):
         """Get string to move the cursor right num or 1 cols."""
-        return f"\033[{num}C"
+        return Term._CUF1 if num == 1 else _seq("C", num)
 
     @staticmethod
     def get_cursor_left(num=1):
         """Get string to move the cursor left num or 1 cols."""
-        return f"\033[{num}D"
+        return Term._CUB1 if num == 1 else _seq("D", num)
 
     @staticmethod
     def get_previous_line(number=1):
         """Get string to go to the start of the previous (up) number line(s)."""
-        return f"\033[{number}E"
+        return Term._PREV1 if number == 1 else _seq("E", number)
 
     @staticmethod
     def get_next_line(number=1):
         """Get string to go to the start of the next (down) number line(s)."""
-        return f"\033[{number}F"
+        return Term._NEXT1 if number == 1 else _seq("F", number)
 
     @staticmethod
     def get_set_cursor_col(num=1):
         """Get string to set the cursor to the absolute column num or 1."""
-        return f"\033[{num}G"
+        return Term._COL1 if num == 1 else _seq("G", num)
 
     @staticmethod
     def get_set_cursor_pos(line=1, col=1):
         """Get string to set the cursor to the absolute position or 1,1."""
-        return f"\033[{line};{col}H"
+        return _pos(line, col, "H")
 
     @staticmethod
     def get_clear_screen_end():
@@ -206,20 +407,25 @@ class Term:
     @staticmethod
     def get_page_up(num=1):
         """Get string to page up num or 1 number of pages."""
-        return f"\033[{num}S"
+        return Term._PGUP1 if num == 1 else _seq("S", num)
 
     @staticmethod
     def get_page_down(num=1):
         """Get string to page down num or 1 number of pages."""
-        return f"\033[{num}T"
+        return Term._PGDN1 if num == 1 else _seq("T", num)
 
     @staticmethod
-    def get_get_cursor_pos():
+    def get_get_cursor_pos(timeout=1.0):
         """
         Get the cursor position.
 
         Get where the terminal thinks the current cursor position is as reported by the terminal.
 
+        Parameters
+        ----------
+        timeout : float
+            Seconds to wait for the terminal to answer before giving up and
+            returning None.
 
         Notes
         -----
@@ -231,30 +437,17 @@ class Term:
 
         """
         # From https://stackoverflow.com/questions/38465171/python-3-capture-return-of-x1b6n-0336n-e6n-ansi-sequence
+        # tty/termios are POSIX-only, so they stay local to this one caller.
         import tty, termios
-        buf = ""
         stdin = sys.stdin.fileno()
         tattr = termios.tcgetattr(stdin)
         try:
             tty.setcbreak(stdin, termios.TCSANOW)
             sys.stdout.write("\x1b[6n")
             sys.stdout.flush()
-
-            while True:
-                buf += sys.stdin.read(1)
-                if buf[-1] == "R":
-                    break
+            return _read_cpr(stdin, timeout)
         finally:
             termios.tcsetattr(stdin, termios.TCSANOW, tattr)
-        # reading the actual values, but what if a keystroke appears while reading
-        # from stdin? As dirty work around, getpos() returns if this fails: None
-        try:
-            matches = re.match(r"^\x1b\[(\d*);(\d*)R", buf)
-            groups = matches.groups()
-        except AttributeError:
-            return None
-
-        return (int(groups[0]), int(groups[1]))
 
     @staticmethod
     def get_save_cursor():
@@ -266,56 +459,201 @@ class Term:
         """Get string to save the current cursor position."""
         return f"\033[u"
 
+    @classmethod
+    def colored(cls, code: str, string: str) -> str:
+        """
+        Return string preceded by the escape code and followed by NORMAL.
+
+        Example
+        -------
+        >>> Term.colored(Term.RED, "oops") == Term.RED + "oops" + Term.NORMAL
+        True
+
+        """
+        if type(string) is not str:
+            string = str(string)
+        return code + string + cls.NORMAL
+
     @staticmethod
-    def get_one_color(color, string):
+    def get_one_color(color: str, string: str) -> str:
         """Get a string in a color, but reset to normal at the end."""
-        return f"{color}{string}{Term.NORMAL}"
+        return Term.colored(color, string)
+
+    @staticmethod
+    def strip_ansi(string):
+        """
+        Return string without any ANSI CSI escape sequences.
+
+        Useful for measuring the printable length of colored text.
+
+        Example
+        -------
+        >>> Term.strip_ansi(Term.get_red("oops"))
+        'oops'
+
+        """
+        global _ANSI_RE
+        if "\x1b" not in string:
+            return string
+        if _ANSI_RE is None:
+            import re
+            _ANSI_RE = re.compile(_ANSI_PATTERN)
+        return _ANSI_RE.sub("", string)
+
+    @staticmethod
+    def get_colored(name, string):
+        """
+        Return string in the color called name, reset to normal at the end.
+
+        Parameters
+        ----------
+        name : str
+            A color method name, e.g. "red", "blue_bg" or "green_bright".
+        string : str
+            The text to color.
+
+        Returns
+        -------
+        str
+
+        Example
+        -------
+        >>> Term.get_colored("red", "oops") == Term.RED + "oops" + Term.NORMAL
+        True
+
+        """
+        pfx, sfx = Term._COLOR_WRAP[name]
+        if type(string) is not str:
+            string = str(string)
+        return pfx + string + sfx
 
     @staticmethod
     def get_black(string):
         """Return a black string."""
-        return Term.one_color(Term.BLACK, string)
+        return Term.colored(Term.BLACK, string)
 
     @staticmethod
     def get_blue(string):
         """Return a blue string."""
-        return Term.one_color(Term.BLUE, string)
+        return Term.colored(Term.BLUE, string)
 
     @staticmethod
     def get_cyan(string):
         """Return a cyan string."""
-        return Term.one_color(Term.CYAN, string)
+        return Term.colored(Term.CYAN, string)
 
     @staticmethod
     def get_green(string):
         """Return a green string."""
-        return Term.one_color(Term.GREEN, string)
+        return Term.colored(Term.GREEN, string)
 
     @staticmethod
     def get_magenta(string):
         """Return a magenta string."""
-        return Term.one_color(Term.MAGENTA, string)
+        return Term.colored(Term.MAGENTA, string)
 
     @staticmethod
     def get_red(string):
         """Return a red string."""
-        return Term.one_color(Term.RED, string)
+        return Term.colored(Term.RED, string)
 
     @staticmethod
     def get_white(string):
         """Return a white string."""
-        return Term.one_color(Term.WHITE, string)
+        return Term.colored(Term.WHITE, string)
 
     @staticmethod
     def get_yellow(string):
         """Return a yellow string."""
-        return Term.one_color(Term.YELLOW, string)
+        return Term.colored(Term.YELLOW, string)
+
+    pass
 
-    ok = green
-    warn = yellow
-    warning = yellow
-    err = red
-    error = red
-    no_ok = red
 
+def _make_color_method(name, seq):
+    """Return a Term method named name that writes seq."""
+    def color_method(self):
+        return self.write(seq)
+    color_method.__name__ = name
+    color_method.__qualname__ = f"Term.{name}"
+    color_method.__doc__ = f"Write {name.upper()}."
+    return color_method
+
+
+# normal() plus one method per _COLOR_WRAP entry (black, black_bg, ...,
+# yellow_bright_bg), each writing the matching class constant.
+_COLOR_TABLE = [("normal", Term.NORMAL)] + [
+    (name, getattr(Term, name.upper())) for name in Term._COLOR_WRAP
+]
+for _name, _color in _COLOR_TABLE:
+    setattr(Term, _name, _make_color_method(_name, _color))
+    pass
+del _name, _color
+
+# Status aliases. They are bound after the loop above so each one is the very
+# same function object as the generated method it names (Term.ok is
+# Term.green).
+_ALIASES = {
+    "ok": "green",
+    "warn": "yellow",
+    "warning": "yellow",
+    "err": "red",
+    "error": "red",
+    "no_ok": "red",
+}
+for _alias, _target in _ALIASES.items():
+    setattr(Term, _alias, getattr(Term, _target))
     pass
+del _alias, _target
+
+
+# Module-level copies of the Term constants, so hot code can do
+# ``from general.term import RED, NORMAL`` and skip the attribute lookup.
+NORMAL = Term.NORMAL
+BLACK = Term.BLACK
+BLACK_BG = Term.BLACK_BG
+BLACK_BRIGHT = Term.BLACK_BRIGHT
+BLACK_BRIGHT_BG = Term.BLACK_BRIGHT_BG
+BLUE = Term.BLUE
+BLUE_BG = Term.BLUE_BG
+BLUE_BRIGHT = Term.BLUE_BRIGHT
+BLUE_BRIGHT_BG = Term.BLUE_BRIGHT_BG
+CYAN = Term.CYAN
+CYAN_BG = Term.CYAN_BG
+CYAN_BRIGHT = Term.CYAN_BRIGHT
+CYAN_BRIGHT_BG = Term.CYAN_BRIGHT_BG
+GREEN = Term.GREEN
+GREEN_BG = Term.GREEN_BG
+GREEN_BRIGHT = Term.GREEN_BRIGHT
+GREEN_BRIGHT_BG = Term.GREEN_BRIGHT_BG
+MAGENTA = Term.MAGENTA
+MAGENTA_BG = Term.MAGENTA_BG
+MAGENTA_BRIGHT = Term.MAGENTA_BRIGHT
+MAGENTA_BRIGHT_BG = Term.MAGENTA_BRIGHT_BG
+RED = Term.RED
+RED_BG = Term.RED_BG
+RED_BRIGHT = Term.RED_BRIGHT
+RED_BRIGHT_BG = Term.RED_BRIGHT_BG
+WHITE = Term.WHITE
+WHITE_BG = Term.WHITE_BG
+WHITE_BRIGHT = Term.WHITE_BRIGHT
+WHITE_BRIGHT_BG = Term.WHITE_BRIGHT_BG
+YELLOW = Term.YELLOW
+YELLOW_BG = Term.YELLOW_BG
+YELLOW_BRIGHT = Term.YELLOW_BRIGHT
+YELLOW_BRIGHT_BG = Term.YELLOW_BRIGHT_BG
+BOLD = Term.BOLD
+UNDERLINE = Term.UNDERLINE
+REVERSED = Term.REVERSED
+UP = Term.UP
+DOWN = Term.DOWN
+RIGHT = Term.RIGHT
+LEFT = Term.LEFT
+HIDE_CURSOR = Term.HIDE_CURSOR
+SHOW_CURSOR = Term.SHOW_CURSOR
+CS_EOF = Term.CS_EOF
+CS_BOF = Term.CS_BOF
+CS = Term.CS
+CL_EOL = Term.CL_EOL
+CL_BOL = Term.CL_BOL
+CL = Term.CL
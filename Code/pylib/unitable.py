@@ -57,15 +57,21 @@ Result:
     delta   0.045     1.000e+10   92        8.900e+13
 """
 
-# TODO: Verify which if these are still needed in Python 3
-from __future__ import division  # Ensure division works the same in Python 2 and 3
-from wcwidth import wcswidth  # For calculating the display width of unicode characters
+# For calculating the display width of unicode characters
+# - Use cwcwidth if available (a C implementation, much faster per call)
+# - Fallback to the pure-Python wcwidth package otherwise
+try:
+    from cwcwidth import wcswidth as _wcswidth
+except ImportError:
+    from wcwidth import wcswidth as _wcswidth
+import math  # isnan() for the automatic number formatting
 import re  # Regular expressions for text processing
 import sys  # System-specific parameters and functions
-from typing import List, Optional, Iterable, Any  # Type hints for better code clarity
-from functools import reduce  # Higher-order function for performing cumulative operations
+from typing import Any, Callable, Iterable, List, Optional  # Type hints for better code clarity
+from enum import IntEnum  # Integer enumerations (for the table styles)
+from functools import partial  # Binding the precision into the per-column formatters
 
-__all__ = ["UniTable", "ArraySizeError", "StringLengthCalculator"]
+__all__ = ["UniTable", "Style", "ArraySizeError", "StringLengthCalculator"]
 
 __author__ = 'Gabriele Fariello <gfariello@fariel.com>'
 __license__ = 'MIT'
@@ -102,47 +108,47 @@ frinkelpi:
     - preserve empty lines
 """
 
-# Attempt to define a text wrapping function to wrap text to a specific width
-# - Use cjkwrap if available (provides better support for CJK characters)
-# - Fallback to textwrap if cjkwrap is not available
-try:
-    import cjkwrap  # Try importing cjkwrap for better CJK character support
-
-    def textwrapper(txt, width):
-        """
-        Wrap text to a specified width using cjkwrap.
+# The wrap function behind textwrapper(), picked on its first call so that importing
+# this module (or building tables that are never drawn) doesn't import the wrapping modules
+_wrap = None
 
-        Args:
-        txt (str): The text to wrap.
-        width (int): The maximum width of each line.
 
-        Returns:
-        List[str]: A list of wrapped lines.
-        """
-        return cjkwrap.wrap(txt, width)
-    pass  # Close block to ensure proper indentation
-except ImportError:  # If cjkwrap is not available, fallback to textwrap
-    try:
-        import textwrap  # Try importing textwrap for text wrapping
+def textwrapper(txt, width):
+    """
+    Wrap text to a specified width.
 
-        def textwrapper(txt, width):
-            """
-            Wrap text to a specified width using textwrap.
+    Uses cjkwrap if available (provides better support for CJK characters) and falls back
+    to textwrap if cjkwrap is not available. The choice is made once, on the first call.
 
-            Args:
-            txt (str): The text to wrap.
-            width (int): The maximum width of each line.
+    Args:
+    txt (str): The text to wrap.
+    width (int): The maximum width of each line.
 
-            Returns:
-            List[str]: A list of wrapped lines.
-            """
-            return textwrap.wrap(txt, width)
+    Returns:
+    List[str]: A list of wrapped lines.
+    """
+    global _wrap
+    if _wrap is None:
+        try:
+            import cjkwrap  # Try importing cjkwrap for better CJK character support
+            _wrap = cjkwrap.wrap
+        except ImportError:  # If cjkwrap is not available, fallback to textwrap
+            try:
+                import textwrap  # Try importing textwrap for text wrapping
+                _wrap = textwrap.wrap
+            except ImportError:  # If both cjkwrap and textwrap are unavailable, raise an error
+                sys.stderr.write("Can't import textwrap module!\n")
+                raise  # Raise an ImportError if textwrap cannot be imported
+            pass  # Close block to ensure proper indentation
         pass  # Close block to ensure proper indentation
-    except ImportError:  # If both cjkwrap and textwrap are unavailable, raise an error
-        sys.stderr.write("Can't import textwrap module!\n")
-        raise  # Raise an ImportError if textwrap cannot be imported
-    pass  # Close block to ensure proper indentation
-pass  # Close block to ensure proper indentation
+    return _wrap(txt, width)
+
+
+# Regular expressions for handling ANSI escape sequences, compiled once for all instances
+_ANSI_ESCAPE_RE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')  # Any ANSI escape sequence
+_NO_END_RESET_RE = re.compile(r'\033\[0m(?!.*\033\[((?!0m)[0-?]*[ -/]*[@-~]))')  # A reset with no later non-reset sequence
+_NON_RESET_RE = re.compile(r'\033\[((?!0m)[0-?]*[ -/]*[@-~])')  # Any sequence other than a reset
+_NON_RESET_NOT_FOLLOWED_RE = re.compile(r'(\033\[(?:(?!0m)[0-?]*[ -/]*[@-~]))(?!.*\033\[0m)')  # A non-reset with no later reset
 
 
 class StringLengthCalculator:
@@ -176,10 +182,20 @@ class StringLengthCalculator:
     without counting the ANSI escape sequences.
     """
 
+    # Maximum number of measured strings remembered per calculator
+    CACHE_SIZE = 8192
+
     def __init__(self):
         # Regular expression to match ANSI escape sequences
         # ANSI escape sequences are used for text formatting (e.g., colors)
-        self.ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+        self.ansi_escape = _ANSI_ESCAPE_RE
+        # Bound substitution method of the pattern, saving the attribute lookups on every miss in len()
+        self._ansi_sub = self.ansi_escape.sub
+        # Display width function (cwcwidth or wcwidth, see the imports above)
+        self._wcswidth = _wcswidth
+        # Memo of already measured strings; tables measure the same cell
+        # values over and over (column widths, then drawing, then wrapping)
+        self._cache = {}
         pass  # Close block to ensure proper indentation
 
     def len(self, string: str) -> int:
@@ -207,17 +223,38 @@ class StringLengthCalculator:
 
         The above example shows how to use the `len` method to calculate the visible length of a string with ANSI escape sequences.
         """
-        # Remove ANSI escape sequences from the string
-        visible_string = self.ansi_escape.sub('', string)
+        # Printable ASCII (no ESC, tabs, or other control characters) is one cell per character
+        if string.isascii() and string.isprintable():
+            return len(string)
+
+        # Return the remembered length if this string was measured before
+        length = self._cache.get(string)
+        if length is not None:
+            return length
+
+        # Remove ANSI escape sequences from the string (there are none without an ESC character)
+        visible_string = self._ansi_sub('', string) if '\x1b' in string else string
 
-        # Return the length of the visible string
+        # Calculate the length of the visible string
         # wcswidth returns the number of cells the string occupies when printed
-        return wcswidth(visible_string)
+        if visible_string.isascii() and visible_string.isprintable():
+            length = len(visible_string)  # Same shortcut once the escape sequences are gone
+        else:
+            length = self._wcswidth(visible_string)
+
+        # Remember it, but bound the memo so huge tables can't grow it forever
+        if len(self._cache) < self.CACHE_SIZE:
+            self._cache[string] = length
+        return length
         pass  # Close block to ensure proper indentation
 
     pass  # Close block to ensure proper indentation
 
 
+# One calculator (and so one length memo) shared by every table and wrapper in the process
+_CALCULATOR = StringLengthCalculator()
+
+
 class ColorAwareWrapper:
     """
     Class to wrap text to a specified width, excluding ANSI escape sequences.
@@ -247,14 +284,13 @@ class ColorAwareWrapper:
 
     The above example would produce:
     ```
-    This is \033[1;31mred\033[0m
-    and this is
-    \033[1;32mgreen\033[0m.
+    This is \033[1;31mred\033[0m and this
+    is \033[1;32mgreen\033[0m.
     ```
     """
     def __init__(self):
-        # Initialize an instance of StringLengthCalculator to handle ANSI escape sequences
-        self.calculator = StringLengthCalculator()
+        # Use the shared StringLengthCalculator to handle ANSI escape sequences
+        self.calculator = _CALCULATOR
         pass  # Close block to ensure proper indentation
 
     def wrap(self, text: str, width: int) -> str:
@@ -284,8 +320,8 @@ class ColorAwareWrapper:
 
         The above example would produce:
         ```
-        This is a sample
-        text to
+        This is a
+        sample text to
         demonstrate
         wrapping
         functionality.
@@ -297,20 +333,28 @@ class ColorAwareWrapper:
         # Initialize an empty line to build up words and an empty list to hold the result
         line, result = [], []
 
+        # Visible length of the current line, kept up to date as words are
+        # added so the line never has to be re-joined and re-measured
+        line_length = 0
+
+        # Local alias of the length function, looked up once instead of once per word
+        vislen = self.calculator.len
+
         # Iterate over the words in the text
         for word in words:
-            # Calculate the length of the current line and the length of the next word
-            line_length = self.calculator.len(' '.join(line))
-            word_length = self.calculator.len(word)
+            # Calculate the length of the next word (only the word is measured)
+            word_length = vislen(word)
 
-            # If adding the next word to the current line would exceed the specified width...
-            if line_length + word_length + len(line) > width:  # +len(line) accounts for spaces between words
-                # ...then add the current line to the result and start a new line
+            # If adding the next word (and its separating space) to a non-empty line would exceed the width...
+            if line and line_length + 1 + word_length > width:
+                # ...then add the current line to the result and start a new line with this word
                 result.append(' '.join(line))
-                line = []  # Reset the line
-
-            # Add the word to the current line
-            line.append(word)
+                line = [word]
+                line_length = word_length
+            else:
+                # Otherwise add the word (and a space if it is not the first) to the current line
+                line_length += word_length + (1 if line else 0)
+                line.append(word)
 
         # If there are any remaining words in the line, add the line to the result
         if line:
@@ -348,10 +392,15 @@ def obj2unicode(obj: Any) -> str:
     print(obj2unicode(123))  # Outputs: '123'
     ```
     """
-    if isinstance(obj, str):
+    obj_type = type(obj)  # Exact type checks are cheaper than isinstance() for the common cases
+    if obj_type is str:
         return obj  # Return the string as it is
-    elif isinstance(obj, bytes):
+    elif obj_type is bytes:
         return obj.decode()  # Decode bytes to string
+    elif isinstance(obj, str):
+        return obj  # Return str subclasses as they are too
+    elif isinstance(obj, bytes):
+        return obj.decode()  # Decode bytes subclasses to string
     return str(obj)  # Convert other types to string
 
 
@@ -433,6 +482,24 @@ class FallbackToText(Exception):
     pass  # Close block to ensure proper indentation
 
 
+class Style(IntEnum):
+    """
+    The built-in table styles, one member per entry in UniTable.STYLES.
+
+    set_style() accepts either a member or its name, e.g. `Style.double` or "double".
+    """
+    ascii = 0
+    ascii2 = 1
+    bold = 2
+    double = 3
+    light2 = 4
+    round = 5
+    round2 = 6
+    light = 7
+    none = 8
+    none2 = 9
+
+
 class UniTable:
     """
     A class that provides functionality for creating and manipulating ASCII tables.
@@ -477,23 +544,27 @@ class UniTable:
     HLINES = 1 << 2  # Horizontal lines between rows
     VLINES = 1 << 3  # Vertical lines between columns
 
+    # Maximum number of entries in each of the per-table memos (cell widths, wrapped cell lines)
+    CACHE_SIZE = 4096
+
     # Constants for line positions
     TOP = 0  # Top border position
     MIDDLE = 1  # Middle position for lines
     BOTTOM = 2  # Bottom border position
 
     # Dictionary defining various table styles and their corresponding border characters
+    # (split into tuples once here so set_style() doesn't re-split a string every time)
     STYLES = {
-        "ascii": "-|+-",  # Basic ASCII style
-        "ascii2": "-|+=",  # ASCII style with different corner characters
-        "bold": "━┃┏┓┗┛┣┫┳┻╋━┣┫╋",  # Bold style with thicker lines
-        "double": "═║╔╗╚╝╠╣╦╩╬═╠╣╬",  # Double line style
-        "light2": "─│┌┐└┘├┤┬┴┼═╞╡╪",  # Light line style with different corners
-        "round": "─│╭╮╰╯├┤┬┴┼─├┤┼",  # Round corners style
-        "round2": "─│╭╮╰╯├┤┬┴┼═╞╡╪",  # Another round corners style
-        "light": "─│┌┐└┘├┤┬┴┼─├┤┼",  # Light line style
-        "none": ["", "", "", "", "", "", "", "", "", "", "", "", "", "", "", ],  # No lines style
-        "none2": ["", "", "", "", "", "", "", "", "", "", "", "", "", "", "", ],  # Another no lines style
+        "ascii": tuple("-|+-"),  # Basic ASCII style
+        "ascii2": tuple("-|+="),  # ASCII style with different corner characters
+        "bold": tuple("━┃┏┓┗┛┣┫┳┻╋━┣┫╋"),  # Bold style with thicker lines
+        "double": tuple("═║╔╗╚╝╠╣╦╩╬═╠╣╬"),  # Double line style
+        "light2": tuple("─│┌┐└┘├┤┬┴┼═╞╡╪"),  # Light line style with different corners
+        "round": tuple("─│╭╮╰╯├┤┬┴┼─├┤┼"),  # Round corners style
+        "round2": tuple("─│╭╮╰╯├┤┬┴┼═╞╡╪"),  # Another round corners style
+        "light": tuple("─│┌┐└┘├┤┬┴┼─├┤┼"),  # Light line style
+        "none": ("",) * 15,  # No lines style
+        "none2": ("",) * 15,  # Another no lines style
     }
 
     # Dictionary mapping complex style patterns to specific characters
@@ -568,13 +639,29 @@ class UniTable:
         self._has_vline_between_cells = True  # Whether there are vertical lines between cells
 
         # Initialize helper classes for string length calculation and color-aware wrapping
-        self._vislen = StringLengthCalculator()  # For calculating visible string length excluding ANSI sequences
+        self._vislen = _CALCULATOR  # For calculating visible string length excluding ANSI sequences (shared)
         self._cwrap = ColorAwareWrapper()  # For wrapping text with ANSI sequences
 
+        # Bounded memos keyed by the cell text itself, so they never need invalidating
+        self._len_cell_cache = {}  # Cell text -> width (see _len_cell())
+        self._wrap_cache = {}  # (Cell line, width) -> wrapped lines (see _splitit())
+
+        # Column widths given with set_cols_width() are kept; computed ones are redone when stale
+        self._fixed_width = False
+
+        # Per-column settings; None until set with the set_*() methods or defaulted by
+        # add_row() (types), _compute_cols_width() (widths) and _check_align() (alignments)
+        self._width = None
+        self._dtype = None
+        self._header_align = None
+        self._align = None
+        self._valign = None
+
         # Reset table properties
         self.reset()
 
         self._precision = 3  # Default precision for numeric values
+        self._col_formatters = None  # Per-column formatting functions, built by _str() when needed
 
         # Added to support rows arg (i.e., adding entire table definition in initialization).
         if rows is not None:
@@ -584,9 +671,9 @@ class UniTable:
         self.set_max_width(max_width)  # Set the maximum width of the table
 
         # Regular expressions for handling ANSI escape sequences in table content
-        self.no_end_reset = re.compile(r'\033\[0m(?!.*\033\[((?!0m)[0-?]*[ -/]*[@-~]))')
-        self.non_reset_sequence = re.compile(r'\033\[((?!0m)[0-?]*[ -/]*[@-~])')
-        self.non_reset_not_followed_by_reset = re.compile(r'(\033\[(?:(?!0m)[0-?]*[ -/]*[@-~]))(?!.*\033\[0m)')
+        self.no_end_reset = _NO_END_RESET_RE
+        self.non_reset_sequence = _NON_RESET_RE
+        self.non_reset_not_followed_by_reset = _NON_RESET_NOT_FOLLOWED_RE
         self.ansi_norm = "\033[0m"  # ANSI reset sequence
 
         # Set default table decorations (border, header, horizontal and vertical lines)
@@ -602,9 +689,24 @@ class UniTable:
         pass  # Close block to ensure proper indentation
 
     def vislen(self, iterable: Iterable) -> int:
-        """Calculate the visible legnth of strings or the length for anythine else."""
-        if isinstance(iterable, bytes) or isinstance(iterable, str):
+        """Calculate the visible legnth of strings or the length for anythine else.
+
+        Bytes are decoded first; numbers and None (which have no length) count as
+        the visible length of their str().
+        """
+        value_type = type(iterable)  # Dispatch on the exact type for the common cases
+        if value_type is str:
+            if iterable.isascii() and iterable.isprintable():
+                return len(iterable)  # Plain ASCII text: no need to go through the calculator
             return self._vislen.len(iterable)
+        if value_type is list:
+            return len(iterable)
+        if value_type is int or value_type is float or iterable is None:
+            return len(str(iterable))
+        if isinstance(iterable, str):
+            return self._vislen.len(iterable)
+        if isinstance(iterable, bytes):
+            return self._vislen.len(iterable.decode())
         return iterable.__len__()
 
     @property
@@ -632,13 +734,35 @@ class UniTable:
 
         - reset rows and header
         """
-        self._hline_string = None
+        self._hline_strings = {}  # Horizontal lines by (is_header, location), see _prepare_decorations()
         self._row_size = None
         self._header = []
-        self._rows = []
+        self._cols = []  # Formatted cells stored column by column (see the _rows property)
+        self._nrows = 0  # Number of rows stored in _cols
+        self._col_max_widths = []  # Widest cell of each column over all rows (see add_row())
+        self._has_ansi = False  # Whether any header or row cell contains an ANSI escape sequence
         self._style = "light"
+        self._dirty = True  # Computed column widths (if any) are stale
         return self
 
+    @property
+    def _rows(self) -> List[List[str]]:
+        """Get the formatted cells row by row (built from the column-major _cols)."""
+        if not self._cols:
+            return [[] for _ in range(self._nrows)]
+        return [list(row) for row in zip(*self._cols)]
+
+    @_rows.setter
+    def _rows(self, rows: List[List[str]]):
+        rows = list(rows)
+        self._cols = [list(col) for col in zip(*rows)]
+        self._nrows = len(rows)
+        self._col_max_widths = [max(map(self._len_cell, col)) for col in self._cols]
+        self._has_ansi = any("\x1b" in cell for col in self._cols for cell in col) or \
+            any("\x1b" in cell for cell in self._header)
+        self._dirty = True
+        return rows
+
     @property
     def max_width(self):
         """Get the maximum width of the table. If 0, no max."""
@@ -655,6 +779,7 @@ class UniTable:
         - if set to 0, size is unlimited, therefore cells won't be wrapped
         """
         self._max_width = max_width if max_width > 0 else False
+        self._dirty = True
         return self
 
     def set_style(self, style: str = "light") -> 'UniTable':
@@ -667,7 +792,11 @@ class UniTable:
 
         Default if none provided is "light"
 
+        A Style member (e.g. Style.double) may be given instead of the name.
+
         """
+        if isinstance(style, Style):
+            style = style.name
         self._style = style
         if style in UniTable.STYLES:
             self.set_table_lines(UniTable.STYLES[style])
@@ -839,6 +968,8 @@ class UniTable:
             pass
         self._check_row_size(array)
         self._dtype = array
+        self._col_formatters = None  # Rebuild the formatters for the new types
+        self._dirty = True
         return self
 
     def set_cols_width(self, array: str) -> 'UniTable':
@@ -854,9 +985,10 @@ class UniTable:
         except ValueError:
             sys.stderr.write("Wrong argument in column width specification\n")
             raise
-        if reduce(min, array) <= 0:
+        if min(array) <= 0:
             raise ValueError("Values less than or equal to zero not allowed. Input: %s" % array)
         self._width = array
+        self._fixed_width = True
         return self
 
     def set_precision(self, width: int) -> 'UniTable':
@@ -868,6 +1000,7 @@ class UniTable:
         if not type(width) is int or width < 0:
             raise ValueError('width must be an integer greater then 0')
         self._precision = width
+        self._col_formatters = None  # Rebuild the formatters with the new precision
         return self
 
     @property
@@ -895,7 +1028,10 @@ class UniTable:
     def header(self, array: List[Any]) -> 'UniTable':
         """Specify the header of the table."""
         self._check_row_size(array)
-        self._header = list(map(obj2unicode, array))
+        self._header = [x if type(x) is str else obj2unicode(x) for x in array]
+        if not self._has_ansi:
+            self._has_ansi = any("\x1b" in cell for cell in self._header)
+        self._dirty = True
         return self
 
     def add_row(self, array: List[str]) -> 'UniTable':
@@ -904,12 +1040,34 @@ class UniTable:
         - cells can contain newlines and tabs
         """
         self._check_row_size(array)
-        if not hasattr(self, "_dtype"):
+        if self._dtype is None:
             self._dtype = ["a"] * self._row_size
+            self._col_formatters = None
         cells = []
         for i, x in enumerate(array):
             cells.append(self._str(i, x))
-        self._rows.append(cells)
+        # Append each cell to its column
+        if not self._cols:
+            self._cols = [[] for _ in cells]
+        for col, cell in zip(self._cols, cells):
+            col.append(cell)
+        self._nrows += 1
+        # Remember if escape sequences will need to be carried over wrapped lines (see _splitit())
+        if not self._has_ansi:
+            self._has_ansi = any("\x1b" in cell for cell in cells)
+        # Keep the per-column maximum cell width up to date so drawing doesn't rescan every row
+        widths = self._col_max_widths
+        if not widths:
+            widths.extend(map(self._len_cell, cells))
+        else:
+            for i, cell in enumerate(cells):
+                length = self._len_cell(cell)
+                if length > widths[i]:
+                    widths[i] = length
+                    pass
+                pass
+            pass
+        self._dirty = True
         return self
 
     def add_rows(self, rows, header=True) -> 'UniTable':
@@ -934,37 +1092,68 @@ class UniTable:
 
     def set_rows(self, rows, header=True) -> 'UniTable':
         """Replace all rows in the table with the provided rows."""
-        self._rows = []
+        self._cols = []
+        self._nrows = 0
+        self._col_max_widths = []
         return self.add_rows(rows, header)
 
     def draw(self):
         """Draw the table and return as string."""
-        if not self._header and not self._rows:
+        if not self._header and not self._nrows:
             return
         self._compute_cols_width()
         self._check_align()
-        out = ""
+        self._prepare_decorations()
+        out = []
         if self.has_border:
-            out += self._hline(location=UniTable.TOP)
+            out.append(self._hline(location=UniTable.TOP))
         if self._header:
-            out += self._draw_line(self._header, isheader=True)
+            out.append(self._draw_line(self._header, isheader=True))
             if self.has_header:
-                out += self._hline_header(location=UniTable.MIDDLE)
+                out.append(self._hline_header(location=UniTable.MIDDLE))
                 pass
             pass
         num = 0
-        length = len(self._rows)
-        for row in self._rows:
+        length = self._nrows
+        # The separator between rows is the same every time
+        row_sep = self._hline(location=UniTable.MIDDLE) if self.has_hlines() else ""
+        for row in self._rows:  # Row view of the columns, built once per draw
             num += 1
-            out += self._draw_line(row)
-            if self.has_hlines() and num < length:
-                out += self._hline(location=UniTable.MIDDLE)
+            out.append(self._draw_line(row))
+            if row_sep and num < length:
+                out.append(row_sep)
         if self._has_border:
-            out += self._hline(location=UniTable.BOTTOM)
-        return out[:-1]
+            out.append(self._hline(location=UniTable.BOTTOM))
+        return "".join(out)[:-1]
+
+    def _prepare_decorations(self) -> None:
+        """
+        Build the decoration strings that are the same for every line of a draw().
+
+        Called by draw() once the column widths and alignments are known. It forgets any
+        horizontal lines built for a previous draw() (the widths, style, padding or
+        decorations may have changed since) and stores the pieces _draw_line() puts around
+        and between cells, along with the padding function of each column (see _make_aligner()).
+        """
+        self._hline_strings = {}
+        pad_str = " " * self._pad
+        self._pad_str = pad_str
+        self._row_left = self._char_ns + pad_str if self.has_border else ""  # Left border and padding
+        self._row_sep = pad_str + (self._char_ns if self.has_vlines() else " ") + pad_str  # Between cells
+        self._row_right = (pad_str + self._char_ns if self.has_border else "") + "\n"  # Right border and newline
+        widths = self._width
+        self._header_aligners = [self._make_aligner(align, width) for align, width in zip(self._header_align, widths)]
+        self._row_aligners = [self._make_aligner(align, width) for align, width in zip(self._align, widths)]
+        pass  # Close block to ensure proper indentation
 
     @classmethod
     def _to_float(cls, x):
+        # Numbers are the common case in numeric tables; check the exact types first
+        x_type = type(x)
+        if x_type is float:
+            return x
+        if x_type is int:
+            return float(x)
         if x is None:
             raise FallbackToText()
         try:
@@ -976,17 +1165,25 @@ class UniTable:
     def _fmt_int(cls, x, **kw):
         """Integer formatting class-method.
 
-        - x will be float-converted and then used.
+        - x will be float-converted and then used, unless the float is
+          already given as the `f` kw-argument.
         """
-        return str(int(round(cls._to_float(x))))
+        f = kw.get('f')
+        if f is None:
+            f = cls._to_float(x)
+        return str(int(f) if f.is_integer() else int(round(f)))
 
     @classmethod
     def _fmt_comma_int(cls, x, **kw):
         """Integer formatting class-method.
 
-        - x will be float-converted and then used.
+        - x will be float-converted and then used, unless the float is
+          already given as the `f` kw-argument.
         """
-        return f"{int(round(cls._to_float(x))):,d}"
+        f = kw.get('f')
+        if f is None:
+            f = cls._to_float(x)
+        return f"{int(round(f)):,d}"
 
     @classmethod
     def _fmt_float(cls, x, **kw):
@@ -997,8 +1194,10 @@ class UniTable:
 
         - precision will be taken from `n` kw-argument.
         """
-        n = kw.get('n')
-        return '%.*f' % (n, cls._to_float(x))
+        f = kw.get('f')
+        if f is None:
+            f = cls._to_float(x)
+        return f"{f:.{kw.get('n')}f}"
 
     @classmethod
     def _fmt_exp(cls, x, **kw):
@@ -1011,12 +1210,16 @@ class UniTable:
         Note:
             precision will be taken from `n` kwarg.
         """
-        n = kw.get('n')
-        return '%.*e' % (n, cls._to_float(x))
+        f = kw.get('f')
+        if f is None:
+            f = cls._to_float(x)
+        return f"{f:.{kw.get('n')}e}"
 
     @classmethod
     def _fmt_text(cls, x, **kw):
         """Format string / text."""
+        if type(x) is str:
+            return x  # Already text, skip the obj2unicode() call
         return obj2unicode(x)
 
     @classmethod
@@ -1025,13 +1228,14 @@ class UniTable:
         f = cls._to_float(x)
         if abs(f) > 1e8:
             fn = cls._fmt_exp
-        elif f != f:  # NaN
+        elif math.isnan(f):
             fn = cls._fmt_text
-        elif f - round(f) == 0:
+        elif f.is_integer():
             fn = cls._fmt_int
         else:
             fn = cls._fmt_float
-        return fn(x, **kw)
+        # Hand over the converted float so it isn't converted again
+        return fn(x, f=f, **kw)
 
     def _str(self, i, x):
         """Handle string formatting of cell data.
@@ -1040,6 +1244,19 @@ class UniTable:
             i(int): index of the cell datatype in self._dtype
             x(any): cell data to format
         """
+        formatters = self._col_formatters
+        if formatters is None:
+            formatters = self._col_formatters = self._build_col_formatters()
+        try:
+            return formatters[i](x)
+        except FallbackToText:
+            return self._fmt_text(x)
+
+    def _build_col_formatters(self) -> list:
+        """Return one formatting function per column from self._dtype and self._precision.
+
+        Callable dtypes are used as they are; the others are bound to the current precision.
+        """
         format_map = {
             'a': self._fmt_auto,
             'i': self._fmt_int,
@@ -1050,14 +1267,14 @@ class UniTable:
         }
 
         n = self._precision
-        dtype = self._dtype[i]
-        try:
+        formatters = []
+        for dtype in self._dtype:
             if callable(dtype):
-                return dtype(x)
+                formatters.append(dtype)
             else:
-                return format_map[dtype](x, n=n)
-        except FallbackToText:
-            return self._fmt_text(x)
+                formatters.append(partial(format_map[dtype], n=n))
+            pass
+        return formatters
 
     def _check_row_size(self, array):
         """Check that the specified array fits the previous rows size."""
@@ -1077,14 +1294,17 @@ class UniTable:
 
     def _hline_header(self, location=MIDDLE):
         """Print header's horizontal line."""
-        return self._build_hline(is_header=True, location=location)
+        hline = self._hline_strings.get((True, location))
+        if hline is None:
+            hline = self._hline_strings[(True, location)] = self._build_hline(is_header=True, location=location)
+        return hline
 
     def _hline(self, location):
         """Print an horizontal line."""
-        # if not self._hline_string:
-        #   self._hline_string = self._build_hline(location)
-        # return self._hline_string
-        return self._build_hline(is_header=False, location=location)
+        hline = self._hline_strings.get((False, location))
+        if hline is None:
+            hline = self._hline_strings[(False, location)] = self._build_hline(is_header=False, location=location)
+        return hline
 
     def _build_hline(self, is_header=False, location=MIDDLE):
         """Return a string used to separated rows or separate header from rows."""
@@ -1104,13 +1324,15 @@ class UniTable:
             left, mid, right = self._char_ne, self._char_new, self._char_nw
         else:
             raise ValueError("Unknown location '%s'. Should be one of UniTable.TOP, UniTable.MIDDLE, or UniTable.BOTTOM." % (location))
+        # padding on either side of a cell separator or border
+        pad = horiz_char * self._pad
         # compute cell separator
-        cell_sep = "%s%s%s" % (horiz_char * self._pad, [horiz_char, mid][self.has_vlines()], horiz_char * self._pad)
+        cell_sep = "%s%s%s" % (pad, mid if self.has_vlines() else horiz_char, pad)
         # build the line
         hline = cell_sep.join([horiz_char * n for n in self._width])
         # add border if needed
         if self.has_border:
-            hline = "%s%s%s%s%s\n" % (left, horiz_char * self._pad, hline, horiz_char * self._pad, right)
+            hline = "%s%s%s%s%s\n" % (left, pad, hline, pad, right)
         else:
             hline += "\n"
         return hline
@@ -1121,16 +1343,26 @@ class UniTable:
         Special characters are taken into account to return the width of the
         cell, such like newlines and tabs.
         """
+        # A single line without tabs is just as wide as its visible length
+        if "\n" not in cell and "\t" not in cell:
+            return self._vislen.len(cell)
+        maxi = self._len_cell_cache.get(cell)
+        if maxi is not None:
+            return maxi
         cell_lines = cell.split('\n')
         maxi = 0
+        vislen = self._vislen.len  # Local alias for the loop below (the parts are strings, no type dispatch needed)
         for line in cell_lines:
             length = 0
             parts = line.split('\t')
-            for part, i in zip(parts, list(range(1, len(parts) + 1))):
-                length = length + self.vislen(part)
-                if i < len(parts):
+            n_parts = len(parts)
+            for i, part in enumerate(parts, 1):
+                length = length + vislen(part)
+                if i < n_parts:
                     length = (length // 8 + 1) * 8
             maxi = max(maxi, length)
+        if len(self._len_cell_cache) < UniTable.CACHE_SIZE:
+            self._len_cell_cache[cell] = maxi
         return maxi
 
     def _compute_cols_width(self) -> None:
@@ -1139,7 +1371,8 @@ class UniTable:
 
         This method calculates the width of each column based on the content and
         adjusts the widths to fit within the maximum table width if specified.
-        If a specific column width is already set, the method exits early.
+        If specific column widths were set, or the widths were already computed and
+        nothing affecting them changed since, the method exits early.
         If the total width exceeds the desired table width, the column widths
         are recomputed to fit, and cell content is wrapped as necessary.
 
@@ -1156,59 +1389,76 @@ class UniTable:
         table._compute_cols_width()
         ```
         """
-        # Check if column widths have already been computed. If so, exit early.
-        if hasattr(self, "_width"):
+        # Check if column widths were set explicitly, or computed and still valid. If so, exit early.
+        if self._width is not None and (self._fixed_width or not self._dirty):
             return
 
-        # Initialize a list to store the maximum width of each column.
-        maxi = []
+        # Start from the maximum width of each column over the rows, maintained by add_row().
+        maxi = list(self._col_max_widths)
 
-        # If there is a header, calculate the maximum width for each column in the header.
-        if self._header:
-            maxi = [self._len_cell(x) for x in self._header]
-
-        # Calculate the maximum width for each column based on the content of each row.
-        for row in self._rows:
-            for cell, i in zip(row, range(len(row))):
-                try:
-                    # Update the maximum width for the current column.
-                    maxi[i] = max(maxi[i], self._len_cell(cell))
-                except (TypeError, IndexError):
-                    # If the column index doesn't exist in maxi, append the new width.
-                    maxi.append(self._len_cell(cell))
+        # If there is a header, widen each column to fit its header cell.
+        header = self._header
+        if header:
+            len_cell = self._len_cell
+            header_widths = [len_cell(x) for x in header]
+            if maxi:
+                maxi = [max(h, r) for h, r in zip(header_widths, maxi)]
+            else:
+                maxi = header_widths
 
         # Calculate the number of columns in the table.
         ncols = len(maxi)
         # Calculate the total content width by summing the maximum widths of all columns.
         content_width = sum(maxi)
         # Calculate the width required for decorations (borders and spaces).
-        deco_width = 3 * (ncols - 1) + [0, 4][self.has_border]
+        deco_width = 3 * (ncols - 1) + (4 if self.has_border else 0)
 
         # Check if the total width (content + decorations) exceeds the maximum allowed width.
-        if self._max_width and (content_width + deco_width) > self._max_width:
+        max_width = self._max_width
+        if max_width and (content_width + deco_width) > max_width:
             # If the maximum width is too low to render the table, raise an error.
-            if self._max_width < (ncols + deco_width):
-                raise ValueError(f"max_width ({self._max_width}) too low to render data. The minimum for this table would be {ncols + deco_width}.")
+            if max_width < (ncols + deco_width):
+                raise ValueError(f"max_width ({max_width}) too low to render data. The minimum for this table would be {ncols + deco_width}.")
 
             # Calculate the available width for content after accounting for decorations.
-            available_width = self._max_width - deco_width
-            # Initialize a new list to store the adjusted maximum widths.
-            newmaxi = [0] * ncols
-            i = 0
-
-            # Distribute the available width among the columns.
-            while available_width > 0:
-                if newmaxi[i] < maxi[i]:
+            available_width = max_width - deco_width
+            # Distribute the available width among the columns evenly ("water filling"): every
+            # column gets min(its width, level) for the highest level the available width allows,
+            # and what is left over goes one by one to the leftmost columns that are still
+            # wider. This is what handing out one character per column in turn would give, but
+            # computed directly instead of one character at a time.
+            remaining = available_width
+            level = 0
+            n_left = ncols  # Columns wider than the current level
+            for width in sorted(maxi):
+                # Raising the level to this column's width costs one character per column still wider
+                cost = (width - level) * n_left
+                if cost > remaining:
+                    break
+                remaining -= cost
+                level = width
+                n_left -= 1
+            # Raise the level as far as the rest allows (the content is wider than available, so n_left > 0)
+            level += remaining // n_left
+            remaining %= n_left
+
+            # Initialize a new list with the adjusted maximum widths.
+            newmaxi = [min(width, level) for width in maxi]
+            for i in range(ncols):
+                if not remaining:
+                    break
+                if maxi[i] > level:
                     newmaxi[i] += 1
-                    available_width -= 1
-                # Cycle through columns to distribute width evenly.
-                i = (i + 1) % ncols
+                    remaining -= 1
+                    pass
+                pass
 
             # Update the column widths with the adjusted values.
             maxi = newmaxi
 
         # Set the computed column widths as the table's column widths.
         self._width = maxi
+        self._dirty = False  # Valid until the rows, header or width limit change
 
     def _check_align(self) -> None:
         """
@@ -1225,13 +1475,13 @@ class UniTable:
         ```
         """
         # Check if header alignment is set; if not, set default alignment to center.
-        if not hasattr(self, "_header_align"):
+        if self._header_align is None:
             self._header_align = ["c"] * self._row_size
         # Check if column alignment is set; if not, set default alignment to left.
-        if not hasattr(self, "_align"):
+        if self._align is None:
             self._align = ["l"] * self._row_size
         # Check if vertical alignment is set; if not, set default alignment to top.
-        if not hasattr(self, "_valign"):
+        if self._valign is None:
             self._valign = ["t"] * self._row_size
 
     def _draw_line(self, line: List[str], isheader: bool = False) -> str:
@@ -1264,49 +1514,66 @@ class UniTable:
         """
         # Split the line into individual cells, handling headers if necessary.
         line = self._splitit(line, isheader)
-        space = " "
-        out = ""
-
-        # Iterate over each row of the split line.
-        for i in range(self.vislen(line[0])):
-            # Add the left border if the table has borders.
-            if self.has_border:
-                out += f"{self._char_ns}{' ' * self._pad}"
-                pass
-
-            length = 0
-
-            # Iterate over each cell in the line.
-            for cell, width, align in zip(line, self._width, self._align):
-                length += 1
-                cell_line = cell[i]
-                fill = width - self.vislen(cell_line)
-
-                # Use header alignment if the line is a header.
-                if isheader:
-                    align = self._header_align[length - 1]
-                    pass
+        parts = []  # Pieces of the output, joined once at the end
+        extend = parts.extend
+
+        # Headers use their own alignment; the padding functions of the columns are built
+        # once per draw() (see _prepare_decorations()), so no alignment is tested per cell.
+        aligners = self._header_aligners if isheader else self._row_aligners
+
+        # Decorations are the same for every row (built by _prepare_decorations()).
+        left = self._row_left
+        inter = self._row_sep
+        right = self._row_right
+
+        # Pad every line of each cell in one pass per column, then iterate over each row
+        # of the split line: left border, the cells separated by spaces/vertical lines,
+        # and right border.
+        padded = [list(map(aligner, cell)) for aligner, cell in zip(aligners, line)]
+        for cells in zip(*padded):
+            extend((left, inter.join(cells), right))
+            pass
 
-                # Align cell content based on the specified alignment.
-                if align == "r":
-                    out += fill * space + cell_line
-                elif align == "c":
-                    out += (int(fill / 2) * space + cell_line + int(fill / 2 + fill % 2) * space)
-                else:
-                    out += cell_line + fill * space
-                    pass
+        return "".join(parts)
 
-                # Add spaces and vertical lines between cells.
-                if length < self.vislen(line):
-                    out += "%s%s%s" % (" " * self._pad, [space, self._char_ns][self.has_vlines()], " " * self._pad)
-                    pass
-
-                pass
+    def _make_aligner(self, align: str, width: int) -> Callable[[str], str]:
+        """
+        Return a function padding one line of a cell to `width` visible characters.
 
-            # Add the right border if the table has borders.
-            out += "%s\n" % ['', " " * self._pad + self._char_ns][self.has_border]
+        Args:
+        -----
+        align : str
+            "l" (left), "c" (center), or "r" (right). Anything else is treated as "l".
+        width : int
+            The width of the column.
 
-        return out
+        Returns:
+        --------
+        Callable[[str], str]
+            The padding function for the column.
+        """
+        # Printable ASCII (no escape sequences or wide characters) is as wide as it is
+        # long, so the str methods can pad it in one call; anything else is measured.
+        vislen = self._vislen.len
+        if align == "r":
+            def aligner(text: str) -> str:
+                if text.isascii() and text.isprintable():
+                    return text.rjust(width)
+                return (width - vislen(text)) * " " + text
+        elif align == "c":
+            def aligner(text: str) -> str:
+                # The odd space (if any) goes to the right, which str.center() does not guarantee
+                if text.isascii() and text.isprintable():
+                    return ((width - len(text)) // 2 * " " + text).ljust(width)
+                fill = width - vislen(text)
+                return fill // 2 * " " + text + (fill // 2 + fill % 2) * " "
+        else:
+            def aligner(text: str) -> str:
+                if text.isascii() and text.isprintable():
+                    return text.ljust(width)
+                return text + (width - vislen(text)) * " "
+            pass  # Close block to ensure proper indentation
+        return aligner
 
     def _splitit(self, line: List[str], isheader: bool) -> List[List[str]]:
         """
@@ -1338,6 +1605,7 @@ class UniTable:
         ```
         """
         line_wrapped = []
+        wrap_cache = self._wrap_cache
 
         # Iterate over each cell and its corresponding column width
         for cell, width in zip(line, self._width):
@@ -1347,30 +1615,39 @@ class UniTable:
                 if c.strip() == "":
                     array.append("")  # Preserve empty lines
                 else:
-                    array.extend(textwrapper(c, width))  # Wrap text to fit the column width
+                    # Wrap text to fit the column width (remembering the result for identical text)
+                    wrapped = wrap_cache.get((c, width))
+                    if wrapped is None:
+                        wrapped = textwrapper(c, width)
+                        if len(wrap_cache) < UniTable.CACHE_SIZE:
+                            wrap_cache[(c, width)] = wrapped
+                    array.extend(wrapped)
             line_wrapped.append(array)
 
         # Find the maximum number of lines in any cell
-        max_cell_lines = reduce(max, list(map(len, line_wrapped)))
+        max_cell_lines = max(map(len, line_wrapped))
 
         # Adjust each cell's vertical alignment
         for cell, valign in zip(line_wrapped, self._valign):
             if isheader:
                 valign = "t"  # Header cells are always top-aligned
+            missing = max_cell_lines - len(cell)
             if valign == "m":
                 # Middle alignment: add missing lines evenly to the top and bottom
-                missing = max_cell_lines - self._vislen.len(cell)
                 cell[:0] = [""] * (missing // 2)
                 cell.extend([""] * (missing // 2 + missing % 2))
             elif valign == "b":
                 # Bottom alignment: add missing lines to the top
-                cell[:0] = [""] * (max_cell_lines - self.vislen(cell))
+                cell[:0] = [""] * missing
             else:
                 # Top alignment (default): add missing lines to the bottom
-                cell.extend([""] * (max_cell_lines - self.vislen(cell)))
+                cell.extend([""] * missing)
                 pass
             pass
 
+        # Without escape sequences in the table there is nothing for _process_lines() to do
+        if not self._has_ansi:
+            return line_wrapped
         return self._process_lines(line_wrapped)
 
     def _process_lines(self, lines_2d: List[List[str]]) -> List[List[str]]:
@@ -1402,20 +1679,23 @@ class UniTable:
         """
         # Initialize a variable to hold any unterminated ANSI escape sequences
         unterminated_sequences = ""
+        find_unterminated = _NON_RESET_NOT_FOLLOWED_RE.findall  # Bound once for the loop below
 
         # Iterate over each line in the 2D list
         for lines in lines_2d:
-            for i in range(len(lines)):
-                # If there was a non-reset sequence in the last line, prepend it to this line
+            for i, line in enumerate(lines):
                 if unterminated_sequences:
-                    lines[i] = unterminated_sequences + lines[i]
-                    unterminated_sequences = ""
+                    # If there was a non-reset sequence in the last line, prepend it to this line
+                    line = lines[i] = unterminated_sequences + line
+                elif "\x1b" not in line:
+                    # Nothing to carry over and no escape sequence to scan for (plain text)
+                    continue
 
                 # Save any ANSI escape sequences that are not terminated by a reset sequence
-                unterminated_sequences = "".join(self.non_reset_not_followed_by_reset.findall(lines[i]))
+                unterminated_sequences = "".join(find_unterminated(line))
                 if unterminated_sequences:
                     # Add a reset sequence to the end of the line
-                    lines[i] += "\033[0m"
+                    lines[i] = line + "\033[0m"
                     pass
                 pass
             pass